@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
 import re
-from collections.abc import Iterable
+import tempfile
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, time
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +19,7 @@ from azure.ai.documentintelligence import DocumentIntelligenceClient
 from azure.ai.documentintelligence.models import (
     AddressValue,
     AnalyzedDocument,
+    AnalyzeResult,
     CurrencyValue,
     DocumentField,
 )
@@ -21,11 +27,38 @@ from azure.core.credentials import AzureKeyCredential
 
 from .conditions import CONDITION_RANKS, condition_rank, normalize_condition_code
 
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _json_loads = json.loads
+else:
+    _json_loads = orjson.loads
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_FALLBACK = Path(__file__).resolve().parents[2] / "samples" / "fallback_extract.json"
 NONE_SELECTED_MESSAGE = "Azure Document Intelligence returned '(None Selected)' for this field."
 
+_DATE_PATTERN = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{2,4})$")
+_NON_DIGIT_PATTERN = re.compile(r"\D")
+_MONEY_STRIP = str.maketrans("", "", ",$ \t")
+_HOA_FREQUENCY_TOKENS: tuple[tuple[str, str], ...] = (("month", "PerMonth"), ("year", "PerYear"))
+_BOOL_LABELS: dict[str, bool] = {
+    "yes": True,
+    "y": True,
+    "true": True,
+    "no": False,
+    "n": False,
+    "false": False,
+}
+_APPRAISAL_TYPE_ALIASES: dict[str, str] = {
+    "as is": "As is",
+    "as-is": "As is",
+    "asis": "As is",
+    "as is condition": "As is",
+}
+
 
 def _normalize_appraisal_type(value: str | None) -> str | None:
     if value is None:
@@ -34,20 +67,15 @@ def _normalize_appraisal_type(value: str | None) -> str | None:
     if not normalized:
         return None
     lowered = normalized.lower()
-    direct_map = {
-        "as is": "As is",
-        "as-is": "As is",
-        "asis": "As is",
-        "as is condition": "As is",
-    }
-    if lowered in direct_map:
-        return direct_map[lowered]
+    alias = _APPRAISAL_TYPE_ALIASES.get(lowered)
+    if alias is not None:
+        return alias
     if lowered.startswith("subject to"):
         return "Subject to"
     return normalized
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionResult:
     payload: dict[str, Any]
     raw_payload: dict[str, Any]
@@ -65,13 +93,18 @@ def _client() -> DocumentIntelligenceClient:
     return DocumentIntelligenceClient(endpoint=endpoint, credential=AzureKeyCredential(key))
 
 
-def _low_conf_threshold() -> float:
+@lru_cache(maxsize=8)
+def _parse_low_conf_threshold(raw: str) -> float:
     try:
-        return float(os.getenv("AZURE_DOCINTEL_LOW_CONFIDENCE", "0.8"))
+        return float(raw)
     except ValueError:
         return 0.8
 
 
+def _low_conf_threshold() -> float:
+    return _parse_low_conf_threshold(os.getenv("AZURE_DOCINTEL_LOW_CONFIDENCE", "0.8"))
+
+
 def _fallback_path() -> Path | None:
     path = os.getenv("AZURE_DOCINTEL_FALLBACK_JSON")
     if path:
@@ -87,8 +120,7 @@ def _load_fallback(model_id: str | None = None) -> ExtractionResult:
         raise RuntimeError(
             "Azure Document Intelligence call failed and no fallback payload is available."
         )
-    with fallback.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
+    data = _json_loads(fallback.read_bytes())
     payload = data.get("payload")
     if payload is None:
         payload = {
@@ -137,6 +169,18 @@ def _field_by_path(doc: AnalyzedDocument, path: str) -> DocumentField | None:
     return current
 
 
+def _index_fields(fields: dict[str, DocumentField], prefix: str = "") -> dict[str, DocumentField]:
+    """Map every dotted object path (as accepted by ``_field_by_path``) to its field."""
+
+    index: dict[str, DocumentField] = {}
+    for name, field in fields.items():
+        path = f"{prefix}{name}"
+        index[path] = field
+        if field is not None and field.value_object:
+            index.update(_index_fields(field.value_object, f"{path}."))
+    return index
+
+
 def _field_text(field: DocumentField | None) -> str | None:
     if field is None:
         return None
@@ -184,27 +228,23 @@ def _addr_split(field: DocumentField | None) -> dict[str, Any]:
     return {k: v for k, v in parts.items() if v not in (None, "")}
 
 
+def _first_selection(field: DocumentField) -> str | None:
+    options: Iterable[str] = field.value_selection_group or []
+    for option in options:
+        label = str(option).strip()
+        if label:
+            return label
+    return None
+
+
 def _pick_selected_label(
     field: DocumentField | None, aliases: dict[str, str] | None = None
 ) -> str | None:
     if field is None:
         return None
-    options: Iterable[str] = field.value_selection_group or []
-    for option in options:
-        label = str(option).strip()
-        if not label:
-            continue
-        if aliases and label in aliases:
-            return aliases[label]
-        return label
-    content = _field_text(field)
-    if content is None:
-        return None
-    label = content.strip()
-    if not label:
-        return None
-    if aliases and label in aliases:
-        return aliases[label]
+    label = _first_selection(field) or _field_text(field)
+    if aliases and label:
+        return aliases.get(label, label)
     return label
 
 
@@ -222,9 +262,9 @@ def _money_to_int(field: DocumentField | None) -> int | None:
     if text is None:
         return None
     try:
-        return int(round(float(text.replace(",", "").replace("$", ""))))
+        return int(round(float(text.translate(_MONEY_STRIP))))
     except Exception:
-        digits = "".join(ch for ch in text if ch.isdigit())
+        digits = _NON_DIGIT_PATTERN.sub("", text)
         return int(digits) if digits else None
 
 
@@ -262,7 +302,7 @@ def _phone_from_field(field: DocumentField | None) -> str | None:
         text = content
     if not text:
         return None
-    digits = "".join(ch for ch in str(text) if ch.isdigit())
+    digits = _NON_DIGIT_PATTERN.sub("", str(text))
     if not digits:
         return None
     if len(digits) == 10:
@@ -336,8 +376,8 @@ def _photo_entry(field: DocumentField | None) -> dict[str, Any]:
     return {}
 
 
-def _reconciliation_section(doc: AnalyzedDocument) -> dict[str, Any]:
-    reconciliation_field = _field_by_path(doc, "Reconciliation")
+def _reconciliation_section(fields: dict[str, DocumentField]) -> dict[str, Any]:
+    reconciliation_field = fields.get("Reconciliation")
     if reconciliation_field is None or not reconciliation_field.value_object:
         return {}
     appraisal_type_field = reconciliation_field.value_object.get("AppraisalType")
@@ -363,40 +403,45 @@ def _reconciliation_section(doc: AnalyzedDocument) -> dict[str, Any]:
     return {k: v for k, v in section.items() if v not in (None, "", [])}
 
 
+_COMPARABLE_KEY_MAP: dict[str, str] = {
+    "identifier": "id",
+    "id": "id",
+    "name": "id",
+    "saleprice": "sale_price",
+    "sale_price": "sale_price",
+    "salepriceadjusted": "sale_price_adjusted",
+    "condition": "condition",
+    "quality": "quality",
+    "grosslivingarea": "gross_living_area",
+    "gross_living_area": "gross_living_area",
+    "site": "site_size",
+    "site_size": "site_size",
+    "view": "view",
+    "location": "location",
+    "datasource": "data_source",
+    "data_source": "data_source",
+    "dateofsale": "date_of_sale",
+    "date_of_sale": "date_of_sale",
+    "adjustments": "adjustments",
+    "netadjustment": "net_adjustment",
+    "grossadjustment": "gross_adjustment",
+    "rooms": "rooms",
+    "bathrooms": "bathrooms",
+    "bedrooms": "bedrooms",
+}
+_COMPARABLE_MONEY_KEYS = frozenset(
+    {"sale_price", "sale_price_adjusted", "net_adjustment", "gross_adjustment"}
+)
+
+
 def _normalize_comparable(obj: dict[str, Any]) -> dict[str, Any]:
     comparable: dict[str, Any] = {}
-    mapping = {
-        "identifier": "id",
-        "id": "id",
-        "name": "id",
-        "saleprice": "sale_price",
-        "sale_price": "sale_price",
-        "salepriceadjusted": "sale_price_adjusted",
-        "condition": "condition",
-        "quality": "quality",
-        "grosslivingarea": "gross_living_area",
-        "gross_living_area": "gross_living_area",
-        "site": "site_size",
-        "site_size": "site_size",
-        "view": "view",
-        "location": "location",
-        "datasource": "data_source",
-        "data_source": "data_source",
-        "dateofsale": "date_of_sale",
-        "date_of_sale": "date_of_sale",
-        "adjustments": "adjustments",
-        "netadjustment": "net_adjustment",
-        "grossadjustment": "gross_adjustment",
-        "rooms": "rooms",
-        "bathrooms": "bathrooms",
-        "bedrooms": "bedrooms",
-    }
     for key, value in obj.items():
         if value in (None, "", []):
             continue
         normalized_key = key.lower().replace(" ", "_")
-        mapped = mapping.get(normalized_key, key)
-        if mapped in {"sale_price", "sale_price_adjusted", "net_adjustment", "gross_adjustment"}:
+        mapped = _COMPARABLE_KEY_MAP.get(normalized_key, key)
+        if mapped in _COMPARABLE_MONEY_KEYS:
             try:
                 comparable[mapped] = int(round(float(value)))
             except (TypeError, ValueError):
@@ -416,8 +461,8 @@ def _normalize_comparable(obj: dict[str, Any]) -> dict[str, Any]:
     return comparable
 
 
-def _sales_comparison_section(doc: AnalyzedDocument) -> dict[str, Any]:
-    section_field = _field_by_path(doc, "SalesComparisonApproach")
+def _sales_comparison_section(fields: dict[str, DocumentField]) -> dict[str, Any]:
+    section_field = fields.get("SalesComparisonApproach")
     if section_field is None:
         return {}
     comparables: list[dict[str, Any]] = []
@@ -499,8 +544,8 @@ def _sales_comparison_section(doc: AnalyzedDocument) -> dict[str, Any]:
     }
 
 
-def _loan_section(doc: AnalyzedDocument) -> dict[str, Any]:
-    loan_field = _field_by_path(doc, "Loan") or _field_by_path(doc, "LoanInformation")
+def _loan_section(fields: dict[str, DocumentField]) -> dict[str, Any]:
+    loan_field = fields.get("Loan") or fields.get("LoanInformation")
     if loan_field is None or not loan_field.value_object:
         return {}
     section = {
@@ -513,8 +558,8 @@ def _loan_section(doc: AnalyzedDocument) -> dict[str, Any]:
     return {k: v for k, v in section.items() if v not in (None, "", [])}
 
 
-def _title_section(doc: AnalyzedDocument) -> dict[str, Any]:
-    title_field = _field_by_path(doc, "Title") or _field_by_path(doc, "TitleInformation")
+def _title_section(fields: dict[str, DocumentField]) -> dict[str, Any]:
+    title_field = fields.get("Title") or fields.get("TitleInformation")
     if title_field is None or not title_field.value_object:
         return {}
     section = {
@@ -535,7 +580,7 @@ def _date_mmddyyyy(field: DocumentField | None) -> str | None:
     if not text:
         return None
     s = text.strip().replace("-", "/").replace(".", "/")
-    m = re.match(r"^(\d{1,2})/(\d{1,2})/(\d{2,4})$", s)
+    m = _DATE_PATTERN.match(s)
     if not m:
         return None
     mm, dd, yy = m.groups()
@@ -550,26 +595,18 @@ def _bool_from_field(field: DocumentField | None) -> bool | None:
     if field.value_boolean is not None:
         return bool(field.value_boolean)
     label = _pick_selected_label(field)
-    if label is None:
-        label = _field_text(field)
     if label is None:
         return None
-    lowered = label.strip().lower()
-    if lowered in {"yes", "y", "true"}:
-        return True
-    if lowered in {"no", "n", "false"}:
-        return False
-    return None
+    return _BOOL_LABELS.get(label.lower())
 
 
 def _hoa_freq(label: str | None) -> str:
     if not label:
         return "None"
     t = label.lower()
-    if "month" in t:
-        return "PerMonth"
-    if "year" in t:
-        return "PerYear"
+    for token, frequency in _HOA_FREQUENCY_TOKENS:
+        if token in t:
+            return frequency
     return "None"
 
 
@@ -577,7 +614,7 @@ def _dom(v) -> str | None:
     if v is None:
         return None
     s = str(v).strip()
-    return "Unk" if s.lower().startswith("unk") else "".join(ch for ch in s if ch.isdigit()) or None
+    return "Unk" if s.lower().startswith("unk") else _NON_DIGIT_PATTERN.sub("", s) or None
 
 
 def _normalize_field_value(field: DocumentField | None) -> Any:
@@ -620,18 +657,20 @@ def _normalize_field_value(field: DocumentField | None) -> Any:
 
 
 def _flatten_field(field: DocumentField, prefix: str) -> dict[str, dict[str, Any]]:
+    value_object = field.value_object
     value_list = getattr(field, "value_list", None)
-    is_container = bool(field.value_object or value_list)
+    confidence = field.confidence
+    is_container = bool(value_object or value_list)
     info = {
         "type": getattr(field, "type", None),
         "value": _normalize_field_value(field),
         "content": _field_text(field),
-        "confidence": float(field.confidence) if field.confidence is not None else None,
+        "confidence": float(confidence) if confidence is not None else None,
         "leaf": not is_container,
     }
     flattened: dict[str, dict[str, Any]] = {prefix: info}
-    if field.value_object:
-        for key, child in field.value_object.items():
+    if value_object:
+        for key, child in value_object.items():
             flattened.update(_flatten_field(child, f"{prefix}.{key}"))
     if value_list:
         for idx, child in enumerate(value_list):
@@ -692,18 +731,128 @@ def _build_business_flags(raw_fields: dict[str, dict[str, Any]]) -> list[dict[st
     return flags
 
 
-def extract_1004_fields(pdf_path: str, model_id: str | None = None) -> ExtractionResult:
-    default_model = os.environ.get("AZURE_DOCINTEL_MODEL_ID", "prebuilt-mortgage.us.1004")
-    mid: str = model_id if model_id is not None else default_model
+def _resolve_model_id(model_id: str | None) -> str:
+    if model_id is not None:
+        return model_id
+    return os.environ.get("AZURE_DOCINTEL_MODEL_ID", "prebuilt-mortgage.us.1004")
+
+
+def _cache_path(cache_dir: str, model_id: str, data: bytes) -> Path:
+    digest = hashlib.sha256(data).hexdigest()
+    safe_model = re.sub(r"[^A-Za-z0-9._-]", "_", model_id)
+    return Path(cache_dir) / f"{safe_model}_{digest}.json"
+
+
+def _read_cache(path: Path) -> Any | None:
+    """Return the cached analysis at ``path``, treating unreadable entries as misses."""
+    if not path.exists():
+        return None
     try:
-        client = _client()
+        return AnalyzeResult(_json_loads(path.read_bytes()))
+    except (OSError, ValueError) as exc:
+        logger.warning("Discarding unreadable Azure Document Intelligence cache entry: %s", exc)
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        return None
+
+
+def _write_cache(path: Path, result: Any) -> None:
+    # Batch extraction writes from several threads, so each writer gets its own temp file
+    # and the rename publishes whichever entry lands last.
+    tmp_name: str | None = None
+    try:
+        encoded = json.dumps(result.as_dict())
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+        ) as handle:
+            tmp_name = handle.name
+            handle.write(encoded)
+        os.replace(tmp_name, path)
+    except (OSError, TypeError, ValueError) as exc:
+        logger.warning("Unable to write Azure Document Intelligence cache entry: %s", exc)
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+
+
+def _analyze_document(
+    client_factory: Callable[[], DocumentIntelligenceClient], pdf_path: str, model_id: str
+) -> Any:
+    cache_dir = os.getenv("AZURE_DOCINTEL_CACHE_DIR")
+    if not cache_dir:
         with open(pdf_path, "rb") as f:
-            poller = client.begin_analyze_document(model_id=mid, body=f)
-        result = poller.result()
+            poller = client_factory().begin_analyze_document(model_id=model_id, body=f)
+            return poller.result()
+
+    with open(pdf_path, "rb") as f:
+        data = f.read()
+    cache_path = _cache_path(cache_dir, model_id, data)
+    cached = _read_cache(cache_path)
+    if cached is not None:
+        return cached
+    poller = client_factory().begin_analyze_document(model_id=model_id, body=BytesIO(data))
+    result = poller.result()
+    _write_cache(cache_path, result)
+    return result
+
+
+def extract_1004_fields(
+    pdf_path: str, model_id: str | None = None, *, diagnostics: bool = True
+) -> ExtractionResult:
+    """Extract the canonical 1004 payload from ``pdf_path``.
+
+    When ``diagnostics`` is False the raw field flattening, missing/low-confidence listings,
+    and business flags are skipped and returned empty; only the payloads are populated.
+    """
+    mid = _resolve_model_id(model_id)
+    try:
+        result = _analyze_document(_client, pdf_path, mid)
     except Exception as exc:  # pragma: no cover - branches driven by runtime failures
         logger.warning("Azure Document Intelligence call failed, loading fallback payload: %s", exc)
         return _load_fallback(mid)
+    return _result_from_analysis(result, mid, diagnostics=diagnostics)
+
+
+def extract_1004_fields_batch(
+    pdf_paths: Iterable[str],
+    model_id: str | None = None,
+    *,
+    diagnostics: bool = True,
+    max_in_flight: int = 16,
+) -> list[ExtractionResult]:
+    """Extract several PDFs concurrently, returning results in input order.
+
+    Analysis calls spend their time waiting on Azure, so up to ``max_in_flight`` documents
+    are submitted and polled from worker threads sharing one client. Each document falls
+    back to the local payload independently when its call fails.
+    """
+    paths = list(pdf_paths)
+    if not paths:
+        return []
+    mid = _resolve_model_id(model_id)
+    try:
+        client = _client()
+    except Exception as exc:  # pragma: no cover - branches driven by runtime failures
+        logger.warning("Azure Document Intelligence call failed, loading fallback payload: %s", exc)
+        return [_load_fallback(mid) for _ in paths]
+
+    def run(path: str) -> ExtractionResult:
+        try:
+            result = _analyze_document(lambda: client, path, mid)
+        except Exception as exc:
+            logger.warning(
+                "Azure Document Intelligence call failed, loading fallback payload: %s", exc
+            )
+            return _load_fallback(mid)
+        return _result_from_analysis(result, mid, diagnostics=diagnostics)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_in_flight, len(paths)))) as executor:
+        return list(executor.map(run, paths))
 
+
+def _result_from_analysis(result: Any, mid: str, *, diagnostics: bool) -> ExtractionResult:
     documents = getattr(result, "documents", None) or []
     doc: Any = documents[0] if documents else None
     if not doc:
@@ -717,8 +866,10 @@ def extract_1004_fields(pdf_path: str, model_id: str | None = None) -> Extractio
             model_id=mid,
         )
 
+    fields = _index_fields(getattr(doc, "fields", None) or {})
+
     # Subject.PropertyAddress is an address object
-    subj_addr_field = _field_by_path(doc, "Subject.PropertyAddress")
+    subj_addr_field = fields.get("Subject.PropertyAddress")
     addr = _addr_split(subj_addr_field)
 
     assign_alias = {
@@ -730,26 +881,22 @@ def extract_1004_fields(pdf_path: str, model_id: str | None = None) -> Extractio
     subject = {
         "address": addr,
         "county": None,
-        "parcel_number": _field_text(_field_by_path(doc, "Subject.AssessorParcelNumber")),
-        "pud_indicator": _bool_from_field(_field_by_path(doc, "Subject.IsPud")),
-        "hoa_amount": _money_to_int(_field_by_path(doc, "Subject.HoaAmount")),
-        "hoa_frequency": _hoa_freq(
-            _pick_selected_label(_field_by_path(doc, "Subject.HoaPaymentInterval"))
-        ),
-        "tax_year": _field_text(_field_by_path(doc, "Subject.TaxYear")),
-        "real_estate_taxes": _money_to_int(_field_by_path(doc, "Subject.RealEstateTaxes")),
-        "public_record_owner": _field_text(_field_by_path(doc, "Subject.PublicRecordOwner")),
-        "borrower_name": _field_text(_field_by_path(doc, "Subject.BorrowerName")),
+        "parcel_number": _field_text(fields.get("Subject.AssessorParcelNumber")),
+        "pud_indicator": _bool_from_field(fields.get("Subject.IsPud")),
+        "hoa_amount": _money_to_int(fields.get("Subject.HoaAmount")),
+        "hoa_frequency": _hoa_freq(_pick_selected_label(fields.get("Subject.HoaPaymentInterval"))),
+        "tax_year": _field_text(fields.get("Subject.TaxYear")),
+        "real_estate_taxes": _money_to_int(fields.get("Subject.RealEstateTaxes")),
+        "public_record_owner": _field_text(fields.get("Subject.PublicRecordOwner")),
+        "borrower_name": _field_text(fields.get("Subject.BorrowerName")),
     }
 
     contract = {
-        "assignment_type": _pick_selected_label(
-            _field_by_path(doc, "Subject.AssignmentType"), assign_alias
-        ),
-        "contract_price": _money_to_int(_field_by_path(doc, "Contract.ContractPrice")),
-        "contract_date": _date_mmddyyyy(_field_by_path(doc, "Contract.ContractDate")),
+        "assignment_type": _pick_selected_label(fields.get("Subject.AssignmentType"), assign_alias),
+        "contract_price": _money_to_int(fields.get("Contract.ContractPrice")),
+        "contract_date": _date_mmddyyyy(fields.get("Contract.ContractDate")),
         "seller_owner_public_record": _pick_selected_label(
-            _field_by_path(doc, "Contract.IsPropertySellerOwnerOfPublicRecord"),
+            fields.get("Contract.IsPropertySellerOwnerOfPublicRecord"),
             {"Yes": "Yes", "No": "No"},
         ),
         "financial_assistance_flag": None,
@@ -761,12 +908,10 @@ def extract_1004_fields(pdf_path: str, model_id: str | None = None) -> Extractio
         "offering_data_source": None,
     }
 
-    appraiser_address = _addr_split(_field_by_path(doc, "Appraiser.CompanyAddress"))
-    appraiser_property_address = _addr_split(
-        _field_by_path(doc, "Appraiser.PropertyAppraisedAddress")
-    )
-    subject_status_field = _field_by_path(doc, "Appraiser.SubjectPropertyStatus")
-    comparable_status_field = _field_by_path(doc, "Appraiser.ComparableSalesStatus")
+    appraiser_address = _addr_split(fields.get("Appraiser.CompanyAddress"))
+    appraiser_property_address = _addr_split(fields.get("Appraiser.PropertyAppraisedAddress"))
+    subject_status_field = fields.get("Appraiser.SubjectPropertyStatus")
+    comparable_status_field = fields.get("Appraiser.ComparableSalesStatus")
     subject_status = None
     if subject_status_field and subject_status_field.value_selection_group:
         subject_status = [
@@ -782,41 +927,39 @@ def extract_1004_fields(pdf_path: str, model_id: str | None = None) -> Extractio
             if str(option).strip()
         ]
     appraiser = {
-        "name": _field_text(_field_by_path(doc, "Appraiser.AppraiserName")),
-        "company_name": _field_text(_field_by_path(doc, "Appraiser.CompanyName")),
+        "name": _field_text(fields.get("Appraiser.AppraiserName")),
+        "company_name": _field_text(fields.get("Appraiser.CompanyName")),
         "company_address": appraiser_address,
-        "email": _field_text(_field_by_path(doc, "Appraiser.EmailAddress")),
-        "phone": _phone_from_field(_field_by_path(doc, "Appraiser.TelephoneNumber")),
-        "appraised_value": _money_to_int(
-            _field_by_path(doc, "Appraiser.AppraisedValueOfSubjectProperty")
-        ),
-        "effective_date": _date_mmddyyyy(_field_by_path(doc, "Appraiser.EffectiveDate")),
-        "signature_date": _date_mmddyyyy(_field_by_path(doc, "Appraiser.SignatureAndReportDate")),
+        "email": _field_text(fields.get("Appraiser.EmailAddress")),
+        "phone": _phone_from_field(fields.get("Appraiser.TelephoneNumber")),
+        "appraised_value": _money_to_int(fields.get("Appraiser.AppraisedValueOfSubjectProperty")),
+        "effective_date": _date_mmddyyyy(fields.get("Appraiser.EffectiveDate")),
+        "signature_date": _date_mmddyyyy(fields.get("Appraiser.SignatureAndReportDate")),
         "subject_property_status": subject_status,
         "comparable_sales_status": comparable_status,
         "property_appraised_address": appraiser_property_address,
         "signature_present": _signature_present(
-            _field_by_path(doc, "Appraiser.AppraiserSignature")
-            or _field_by_path(doc, "Appraiser.Signature")
-            or _field_by_path(doc, "Appraiser.SignaturePresent")
+            fields.get("Appraiser.AppraiserSignature")
+            or fields.get("Appraiser.Signature")
+            or fields.get("Appraiser.SignaturePresent")
         ),
     }
 
     photos_candidates = {
-        "front_exterior": _photo_entry(_field_by_path(doc, "Photos.FrontExterior")),
-        "rear_exterior": _photo_entry(_field_by_path(doc, "Photos.RearExterior")),
-        "street_scene": _photo_entry(_field_by_path(doc, "Photos.StreetScene")),
-        "kitchen": _photo_entry(_field_by_path(doc, "Photos.Kitchen")),
-        "bathroom": _photo_entry(_field_by_path(doc, "Photos.Bathroom")),
-        "living_room": _photo_entry(_field_by_path(doc, "Photos.LivingRoom")),
-        "other": _photo_entry(_field_by_path(doc, "Photos.Other")),
+        "front_exterior": _photo_entry(fields.get("Photos.FrontExterior")),
+        "rear_exterior": _photo_entry(fields.get("Photos.RearExterior")),
+        "street_scene": _photo_entry(fields.get("Photos.StreetScene")),
+        "kitchen": _photo_entry(fields.get("Photos.Kitchen")),
+        "bathroom": _photo_entry(fields.get("Photos.Bathroom")),
+        "living_room": _photo_entry(fields.get("Photos.LivingRoom")),
+        "other": _photo_entry(fields.get("Photos.Other")),
     }
     photos = {k: v for k, v in photos_candidates.items() if v}
 
-    reconciliation = _reconciliation_section(doc)
-    sales_comparison = _sales_comparison_section(doc)
-    loan = _loan_section(doc)
-    title = _title_section(doc)
+    reconciliation = _reconciliation_section(fields)
+    sales_comparison = _sales_comparison_section(fields)
+    loan = _loan_section(fields)
+    title = _title_section(fields)
 
     def prune(obj: dict[str, Any]) -> dict[str, Any]:
         cleaned: dict[str, Any] = {}
@@ -848,21 +991,31 @@ def extract_1004_fields(pdf_path: str, model_id: str | None = None) -> Extractio
     }
 
     raw_payload = {
-        "subject": _normalize_field_value(_field_by_path(doc, "Subject")) or {},
-        "contract": _normalize_field_value(_field_by_path(doc, "Contract")) or {},
-        "appraiser": _normalize_field_value(_field_by_path(doc, "Appraiser")) or {},
-        "photos": _normalize_field_value(_field_by_path(doc, "Photos")) or {},
-        "reconciliation": _normalize_field_value(_field_by_path(doc, "Reconciliation")) or {},
-        "sales_comparison": _normalize_field_value(_field_by_path(doc, "SalesComparisonApproach"))
+        "subject": _normalize_field_value(fields.get("Subject")) or {},
+        "contract": _normalize_field_value(fields.get("Contract")) or {},
+        "appraiser": _normalize_field_value(fields.get("Appraiser")) or {},
+        "photos": _normalize_field_value(fields.get("Photos")) or {},
+        "reconciliation": _normalize_field_value(fields.get("Reconciliation")) or {},
+        "sales_comparison": _normalize_field_value(fields.get("SalesComparisonApproach")) or {},
+        "loan": _normalize_field_value(fields.get("Loan"))
+        or _normalize_field_value(fields.get("LoanInformation"))
         or {},
-        "loan": _normalize_field_value(_field_by_path(doc, "Loan"))
-        or _normalize_field_value(_field_by_path(doc, "LoanInformation"))
-        or {},
-        "title": _normalize_field_value(_field_by_path(doc, "Title"))
-        or _normalize_field_value(_field_by_path(doc, "TitleInformation"))
+        "title": _normalize_field_value(fields.get("Title"))
+        or _normalize_field_value(fields.get("TitleInformation"))
         or {},
     }
 
+    if not diagnostics:
+        return ExtractionResult(
+            payload=payload,
+            raw_payload=raw_payload,
+            raw_fields={},
+            missing_fields=[],
+            low_confidence_fields=[],
+            business_flags=[],
+            model_id=mid,
+        )
+
     raw_fields = _flatten_document_fields(doc)
     threshold = _low_conf_threshold()
     missing_fields = sorted(
@@ -42,10 +42,9 @@ def condition_rank(value: Any) -> int | None:
             return integer
         return None
     if isinstance(value, str):
-        code = normalize_condition_code(value)
-        if code is None:
-            return None
-        return CONDITION_RANKS.get(code)
+        # The captured digit is the rank itself (see CONDITION_RANKS); skip building the code.
+        match = _CONDITION_CODE_PATTERN.search(value)
+        return int(match.group(1)) if match else None
     if isinstance(value, dict):
         # Try rank first to support payload structures like {"condition_rank": 3}.
         rank_value = value.get("condition_rank")
@@ -60,12 +59,21 @@ def condition_rank(value: Any) -> int | None:
 def condition_stats(ranks: Iterable[int]) -> tuple[float, float]:
     """Return the mean and population standard deviation for the given ranks."""
 
-    values = [int(rank) for rank in ranks]
-    if not values:
+    # Ranks are integers, so a single pass accumulating exact integer sums gives the
+    # variance without materializing the values or losing precision.
+    count = 0
+    total = 0
+    total_sq = 0
+    for rank in ranks:
+        value = int(rank)
+        count += 1
+        total += value
+        total_sq += value * value
+    if count == 0:
         return 0.0, 0.0
-    mean = sum(values) / len(values)
-    if len(values) == 1:
+    mean = total / count
+    if count == 1:
         return mean, 0.0
-    variance = sum((value - mean) ** 2 for value in values) / len(values)
+    variance = (count * total_sq - total * total) / (count * count)
     std_dev = math.sqrt(variance)
     return mean, std_dev
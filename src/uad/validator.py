@@ -3,7 +3,11 @@ from __future__ import annotations
 import ast
 import json
 import re
+import sys
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Any, cast
 
@@ -14,7 +18,17 @@ from .conditions import condition_rank, condition_stats
 
 SIGNATURE_REQUIREMENTS_PATH = "registry/signature_requirements.json"
 PHOTO_REQUIREMENTS_PATH = "registry/photo_requirements.json"
+FAIL_FAST_SCHEMA_ERRORS = 10
 
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+# Config file path alongside the modification time and size its cached parse belongs to.
+FileKey = tuple[str, int, int]
+# Requirement path as written in the config alongside its pre-split parts.
+RequirementPath = tuple[str, tuple[str, ...]]
+# Azure photo field code alongside the pre-split payload path it maps to.
+PhotoEntry = tuple[str, tuple[str, ...]]
 
 SOURCE_LABELS: dict[str, str] = {
     "uad": "UAD",
@@ -24,7 +38,7 @@ SOURCE_LABELS: dict[str, str] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     field: str
     message: str
@@ -44,138 +58,265 @@ class Finding:
         return payload
 
 
-class AttrDict(dict):
-    """Dictionary supporting attribute access returning None when missing."""
+@dataclass(slots=True)
+class CrossRule:
+    """Registry cross-rule with its expression pre-split and parsed."""
+
+    rule: dict[str, Any]
+    rule_type: str | None
+    rule_id: str
+    severity: str
+    desc: str
+    expr: str
+    implication: bool
+    antecedent: ast.AST | None
+    consequent: ast.AST | None
 
-    def __getattr__(self, item: str) -> Any:
-        return self.get(item)
 
+@dataclass(slots=True)
+class FieldSpec:
+    """Registry field requirement with its payload path pre-split."""
 
-def _load_json(path: str | Path) -> dict[str, Any]:
+    code: str
+    parts: tuple[str, ...]
+    uad: str
+    severity: str
+    message: str
+    always_required: bool
+    required_when: str | None
+    condition: ast.AST | None
+
+
+@dataclass(slots=True)
+class CompiledRegistry:
+    """Registry rules prepared once so validation only evaluates them."""
+
+    fields: tuple[FieldSpec, ...]
+    cross_rules: tuple[CrossRule, ...]
+    alignment_fields: tuple[RequirementPath, ...]
+
+
+def _file_key(path: str | Path) -> FileKey:
     data_path = Path(path)
     if not data_path.is_absolute():
-        base_dir = Path(__file__).resolve().parents[2]
-        data_path = base_dir / data_path
-    with data_path.open("r", encoding="utf-8") as handle:
+        data_path = _REPO_ROOT / data_path
+    stat = data_path.stat()
+    return str(data_path), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=16)
+def _load_json_cached(key: FileKey) -> dict[str, Any]:
+    with open(key[0], encoding="utf-8") as handle:
         return cast(dict[str, Any], json.load(handle))
 
 
-def _to_attr(value: Any) -> Any:
-    if isinstance(value, dict):
-        return AttrDict({k: _to_attr(v) for k, v in value.items()})
-    if isinstance(value, list):
-        return [_to_attr(v) for v in value]
-    return value
+def _load_json(path: str | Path) -> dict[str, Any]:
+    """Load a JSON document relative to the repository root.
+
+    Documents are cached per file and modification time, so the returned dict is shared
+    between calls and must be treated as read-only.
+    """
+
+    return _load_json_cached(_file_key(path))
+
+
+@lru_cache(maxsize=8)
+def _schema_validator(key: FileKey) -> Draft202012Validator:
+    return Draft202012Validator(_load_json_cached(key))
+
+
+@lru_cache(maxsize=8)
+def _compiled_registry(key: FileKey) -> CompiledRegistry:
+    return _compile_registry(_load_json_cached(key))
+
+
+_EXPR_LITERALS: tuple[tuple[re.Pattern[str], str], ...] = (
+    (re.compile(r"\btrue\b", re.IGNORECASE), "True"),
+    (re.compile(r"\bfalse\b", re.IGNORECASE), "False"),
+    (re.compile(r"\bnull\b", re.IGNORECASE), "None"),
+)
+_LAST_NAME_SPLIT_RE = re.compile(r"[\s\-&]+")
+_UNSET = object()
+_AS_IS_FORMS = frozenset({"as-is", "asis", "as is"})
 
 
 def _normalize_expr(expr: str) -> str:
-    replacements = {
-        r"\btrue\b": "True",
-        r"\bfalse\b": "False",
-        r"\bnull\b": "None",
-    }
     normalized = expr
-    for pattern, replacement in replacements.items():
-        normalized = re.sub(pattern, replacement, normalized, flags=re.IGNORECASE)
+    for pattern, replacement in _EXPR_LITERALS:
+        normalized = pattern.sub(replacement, normalized)
     return normalized
 
 
+@lru_cache(maxsize=512)
+def _compile_expr(expr: str) -> ast.AST | None:
+    """Normalize and parse a registry expression, returning ``None`` when it is invalid."""
+
+    try:
+        tree = ast.parse(_normalize_expr(expr), mode="eval")
+    except SyntaxError:
+        return None
+    if not all(isinstance(node, _ALLOWED_NODES) for node in ast.walk(tree)):
+        return None
+    return tree.body
+
+
 def _normalize_last_name(value: Any) -> str | None:
     if not isinstance(value, str):
         return None
-    tokens = [
-        token.strip(" ,.").upper() for token in re.split(r"[\s\-&]+", value) if token.strip(" ,.")
-    ]
-    if not tokens:
-        return None
-    return tokens[-1]
+    # Only the final non-empty token matters, so scan from the end instead of normalizing all.
+    for token in reversed(_LAST_NAME_SPLIT_RE.split(value)):
+        stripped = token.strip(" ,.")
+        if stripped:
+            return stripped.upper()
+    return None
 
 
-def _evaluate_node(node: ast.AST, context: dict[str, Any]) -> Any:
-    if isinstance(node, ast.Expression):
-        return _evaluate_node(node.body, context)
-    if isinstance(node, ast.BoolOp):
-        values = [_evaluate_node(value, context) for value in node.values]
-        if isinstance(node.op, ast.And):
-            return all(bool(v) for v in values)
-        if isinstance(node.op, ast.Or):
-            return any(bool(v) for v in values)
-        raise ValueError("Unsupported boolean operator")
-    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+def _eval_expression(node: ast.Expression, context: dict[str, Any]) -> Any:
+    return _evaluate_node(node.body, context)
+
+
+def _eval_bool_op(node: ast.BoolOp, context: dict[str, Any]) -> Any:
+    if isinstance(node.op, ast.And):
+        return all(_evaluate_node(value, context) for value in node.values)
+    if isinstance(node.op, ast.Or):
+        return any(_evaluate_node(value, context) for value in node.values)
+    raise ValueError("Unsupported boolean operator")
+
+
+def _eval_unary_op(node: ast.UnaryOp, context: dict[str, Any]) -> Any:
+    if isinstance(node.op, ast.Not):
         return not bool(_evaluate_node(node.operand, context))
-    if isinstance(node, ast.Compare):
-        left = _evaluate_node(node.left, context)
-        for operator, comparator in zip(node.ops, node.comparators, strict=False):
-            right = _evaluate_node(comparator, context)
-            if isinstance(operator, ast.Eq):
-                outcome = left == right
-            elif isinstance(operator, ast.NotEq):
-                outcome = left != right
-            elif isinstance(operator, ast.In):
-                try:
-                    outcome = left in right
-                except TypeError:
-                    outcome = False
-            elif isinstance(operator, ast.NotIn):
-                try:
-                    outcome = left not in right
-                except TypeError:
-                    outcome = True
-            else:
-                raise ValueError("Unsupported comparison operator")
-            if not outcome:
-                return False
-            left = right
-        return True
-    if isinstance(node, ast.Name):
-        lowered = node.id.lower()
-        if lowered == "true":
-            return True
-        if lowered == "false":
-            return False
-        if lowered == "none":
-            return None
-        return context.get(node.id)
-    if isinstance(node, ast.Attribute):
-        base = _evaluate_node(node.value, context)
-        if base is None:
-            return None
-        if isinstance(base, dict):
-            return base.get(node.attr)
-        return getattr(base, node.attr, None)
-    if isinstance(node, ast.Constant):
-        return node.value
-    if isinstance(node, ast.List):
-        return [_evaluate_node(element, context) for element in node.elts]
-    if isinstance(node, ast.Tuple):
-        return tuple(_evaluate_node(element, context) for element in node.elts)
-    if isinstance(node, ast.Subscript):
-        base = _evaluate_node(node.value, context)
-        key = _evaluate_node(node.slice, context)
-        try:
-            return base[key]
-        except Exception:
-            return None
     raise ValueError(f"Unsupported expression: {ast.dump(node)}")
 
 
-def _safe_eval(expr: str, context: dict[str, Any]) -> bool:
-    if not expr:
+def _eval_compare(node: ast.Compare, context: dict[str, Any]) -> Any:
+    left = _evaluate_node(node.left, context)
+    for operator, comparator in zip(node.ops, node.comparators, strict=False):
+        right = _evaluate_node(comparator, context)
+        if isinstance(operator, ast.Eq):
+            outcome = left == right
+        elif isinstance(operator, ast.NotEq):
+            outcome = left != right
+        elif isinstance(operator, ast.In):
+            try:
+                outcome = left in right
+            except TypeError:
+                outcome = False
+        elif isinstance(operator, ast.NotIn):
+            try:
+                outcome = left not in right
+            except TypeError:
+                outcome = True
+        else:
+            raise ValueError("Unsupported comparison operator")
+        if not outcome:
+            return False
+        left = right
+    return True
+
+
+def _eval_name(node: ast.Name, context: dict[str, Any]) -> Any:
+    lowered = node.id.lower()
+    if lowered == "true":
+        return True
+    if lowered == "false":
         return False
-    normalized = _normalize_expr(expr)
+    if lowered == "none":
+        return None
+    return context.get(node.id)
+
+
+def _eval_attribute(node: ast.Attribute, context: dict[str, Any]) -> Any:
+    base = _evaluate_node(node.value, context)
+    if base is None:
+        return None
+    if isinstance(base, dict):
+        return base.get(node.attr)
+    return getattr(base, node.attr, None)
+
+
+def _eval_constant(node: ast.Constant, context: dict[str, Any]) -> Any:
+    return node.value
+
+
+def _eval_list(node: ast.List, context: dict[str, Any]) -> Any:
+    return [_evaluate_node(element, context) for element in node.elts]
+
+
+def _eval_tuple(node: ast.Tuple, context: dict[str, Any]) -> Any:
+    return tuple(_evaluate_node(element, context) for element in node.elts)
+
+
+def _eval_subscript(node: ast.Subscript, context: dict[str, Any]) -> Any:
+    base = _evaluate_node(node.value, context)
+    key = _evaluate_node(node.slice, context)
     try:
-        tree = ast.parse(normalized, mode="eval")
-    except SyntaxError:
+        return base[key]
+    except Exception:
+        return None
+
+
+_NODE_HANDLERS: dict[type[ast.AST], Callable[[Any, dict[str, Any]], Any]] = {
+    ast.Expression: _eval_expression,
+    ast.BoolOp: _eval_bool_op,
+    ast.UnaryOp: _eval_unary_op,
+    ast.Compare: _eval_compare,
+    ast.Name: _eval_name,
+    ast.Attribute: _eval_attribute,
+    ast.Constant: _eval_constant,
+    ast.List: _eval_list,
+    ast.Tuple: _eval_tuple,
+    ast.Subscript: _eval_subscript,
+}
+
+# Every node type a compiled expression may contain; anything else is rejected up front so
+# evaluation never meets an unsupported construct halfway through a short-circuited operand.
+_ALLOWED_NODES: tuple[type[ast.AST], ...] = (
+    *_NODE_HANDLERS,
+    ast.And,
+    ast.Or,
+    ast.Not,
+    ast.Eq,
+    ast.NotEq,
+    ast.In,
+    ast.NotIn,
+    ast.Load,
+)
+
+
+def _evaluate_node(node: ast.AST, context: dict[str, Any]) -> Any:
+    handler = _NODE_HANDLERS.get(type(node))
+    if handler is None:
+        raise ValueError(f"Unsupported expression: {ast.dump(node)}")
+    return handler(node, context)
+
+
+def _eval_compiled(node: ast.AST | None, context: dict[str, Any]) -> bool:
+    if node is None:
         return False
     try:
-        result = _evaluate_node(tree.body, context)
+        result = _evaluate_node(node, context)
     except ValueError:
         return False
     return bool(result)
 
 
+def _safe_eval(expr: str, context: dict[str, Any]) -> bool:
+    if not expr:
+        return False
+    return _eval_compiled(_compile_expr(expr), context)
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path: str) -> tuple[str, ...]:
+    return tuple(path.split("."))
+
+
 def _get_field(payload: dict[str, Any], path: str) -> Any:
-    parts = path.split(".")
+    return _get_field_parts(payload, _split_path(path))
+
+
+def _get_field_parts(payload: dict[str, Any], parts: tuple[str, ...]) -> Any:
     current: Any = payload
     for part in parts:
         if isinstance(current, dict):
@@ -189,101 +330,163 @@ def _is_missing(value: Any) -> bool:
     if value is None:
         return True
     if isinstance(value, str):
-        return value.strip() == ""
-    if isinstance(value, list | dict):
-        return len(value) == 0
+        # Only strings starting with whitespace can strip down to nothing.
+        return not value or (value[0].isspace() and not value.strip())
+    if isinstance(value, (list, dict)):
+        return not value
     return False
 
 
-def _schema_findings(payload: dict[str, Any], schema: dict[str, Any]) -> list[Finding]:
-    validator = Draft202012Validator(schema)
-    findings: list[Finding] = []
-    for error in validator.iter_errors(payload):
+def _field_missing(payload: dict[str, Any], parts: tuple[str, ...]) -> bool:
+    """Fused ``_is_missing(_get_field_parts(payload, parts))`` for the requirement loops."""
+
+    current: Any = payload
+    for part in parts:
+        if not isinstance(current, dict):
+            return True
+        current = current.get(part)
+        if current is None:
+            return True
+    return _is_missing(current)
+
+
+def _schema_findings(
+    payload: dict[str, Any], validator: Draft202012Validator, max_errors: int | None = None
+) -> Iterator[Finding]:
+    # jsonschema produces errors lazily, so stopping early skips the rest of the traversal.
+    for error in islice(validator.iter_errors(payload), max_errors):
         path = ".".join(str(p) for p in error.path)
-        findings.append(
-            Finding(
-                field=path or "$",
-                message=error.message,
-                severity="error",
-                rule="schema",
-            )
+        yield Finding(
+            field=path or "$",
+            message=error.message,
+            severity="error",
+            rule="schema",
         )
-    return findings
 
 
 def _field_requirements(
-    payload: dict[str, Any], registry: dict[str, Any], context: dict[str, Any]
+    payload: dict[str, Any], fields: tuple[FieldSpec, ...], context: dict[str, Any]
 ) -> list[Finding]:
     findings: list[Finding] = []
-    for field in registry.get("fields", []):
-        code = field.get("code")
-        if not code:
-            continue
-        uad_type = field.get("uad", "Requirement")
-        condition_expr = field.get("required_when")
-        condition = True if uad_type == "Requirement" and not condition_expr else False
-        if condition_expr:
-            condition = _safe_eval(condition_expr, context)
-        if not condition:
-            continue
-        value = _get_field(payload, code)
-        if _is_missing(value):
-            severity = "error" if uad_type == "Requirement" else "warn"
+    # Several fields usually share a required_when expression; evaluate each one once.
+    conditions: dict[str, bool] = {}
+    for spec in fields:
+        # Unconditional requirements (the common case) go straight to the missing check.
+        if not spec.always_required:
+            if not spec.required_when:
+                continue
+            applies = conditions.get(spec.required_when)
+            if applies is None:
+                applies = _eval_compiled(spec.condition, context)
+                conditions[spec.required_when] = applies
+            if not applies:
+                continue
+        if _field_missing(payload, spec.parts):
             findings.append(
                 Finding(
-                    field=code,
-                    message=f"Field '{code}' is required",
-                    severity=severity,
+                    field=spec.code,
+                    message=spec.message,
+                    severity=spec.severity,
                     rule="uad_requirement",
                 )
             )
     return findings
 
 
+def _intern(value: Any) -> Any:
+    # Registry strings come from JSON; interning lets every finding share one object per id.
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _compile_cross_rule(rule: dict[str, Any]) -> CrossRule:
+    expr = rule.get("expr") or ""
+    implication = "->" in expr
+    antecedent: ast.AST | None = None
+    if implication:
+        antecedent_raw, consequent_raw = expr.split("->", 1)
+        antecedent = _compile_expr(antecedent_raw.strip())
+        consequent = _compile_expr(consequent_raw.strip())
+    else:
+        consequent = _compile_expr(expr) if expr else None
+    return CrossRule(
+        rule=rule,
+        rule_type=rule.get("type"),
+        rule_id=_intern(rule.get("id", "")),
+        severity=_intern(rule.get("severity", "warn")),
+        desc=rule.get("desc", ""),
+        expr=expr,
+        implication=implication,
+        antecedent=antecedent,
+        consequent=consequent,
+    )
+
+
+def _compile_field(field: dict[str, Any]) -> FieldSpec | None:
+    code = field.get("code")
+    if not code:
+        return None
+    required_when = field.get("required_when") or None
+    uad_type = field.get("uad", "Requirement")
+    return FieldSpec(
+        code=code,
+        parts=tuple(code.split(".")),
+        uad=uad_type,
+        severity="error" if uad_type == "Requirement" else "warn",
+        message=f"Field '{code}' is required",
+        always_required=uad_type == "Requirement" and not required_when,
+        required_when=required_when,
+        condition=_compile_expr(required_when) if required_when else None,
+    )
+
+
+def _compile_registry(registry: dict[str, Any]) -> CompiledRegistry:
+    fields = (_compile_field(field) for field in registry.get("fields", []))
+    return CompiledRegistry(
+        fields=tuple(spec for spec in fields if spec is not None),
+        cross_rules=tuple(_compile_cross_rule(rule) for rule in registry.get("cross_rules", [])),
+        alignment_fields=tuple(
+            (field, tuple(field.split("."))) for field in _alignment_fields(registry)
+        ),
+    )
+
+
 def _cross_rule_findings(
-    payload: dict[str, Any], registry: dict[str, Any], context: dict[str, Any]
+    payload: dict[str, Any], cross_rules: tuple[CrossRule, ...], context: dict[str, Any]
 ) -> list[Finding]:
     findings: list[Finding] = []
-    for rule in registry.get("cross_rules", []):
-        rule_type = rule.get("type")
+    # Identical antecedents share one cached AST node, so rules with a common precondition
+    # evaluate it once per payload while findings keep registry order.
+    antecedents: dict[ast.AST | None, bool] = {}
+    for spec in cross_rules:
+        rule_type = spec.rule_type
         if rule_type == "refinance_owner_match":
-            findings.extend(_refinance_owner_match_findings(rule, payload))
+            findings.extend(_refinance_owner_match_findings(spec.rule, payload))
             continue
         if rule_type == "reconciliation_appraisal_type":
-            findings.extend(_reconciliation_appraisal_type_findings(rule, payload))
+            findings.extend(_reconciliation_appraisal_type_findings(spec.rule, payload))
             continue
         if rule_type == "comparable_condition_consistency":
-            findings.extend(_comparable_condition_findings(rule, payload))
+            findings.extend(_comparable_condition_findings(spec.rule, payload))
             continue
-        expr = rule.get("expr")
-        if not expr:
+        if not spec.expr:
             continue
-        severity = rule.get("severity", "warn")
-        rule_id = rule.get("id", "")
-        desc = rule.get("desc", "")
-        if "->" in expr:
-            antecedent_raw, consequent_raw = expr.split("->", 1)
-            antecedent = antecedent_raw.strip()
-            consequent = consequent_raw.strip()
-            if _safe_eval(antecedent, context) and not _safe_eval(consequent, context):
-                findings.append(
-                    Finding(
-                        field=desc or rule_id,
-                        message=desc or expr,
-                        severity=severity,
-                        rule=rule_id or "cross_rule",
-                    )
-                )
+        if spec.implication:
+            applies = antecedents.get(spec.antecedent)
+            if applies is None:
+                applies = _eval_compiled(spec.antecedent, context)
+                antecedents[spec.antecedent] = applies
+            violated = applies and not _eval_compiled(spec.consequent, context)
         else:
-            if not _safe_eval(expr, context):
-                findings.append(
-                    Finding(
-                        field=desc or rule_id,
-                        message=desc or expr,
-                        severity=severity,
-                        rule=rule_id or "cross_rule",
-                    )
+            violated = not _eval_compiled(spec.consequent, context)
+        if violated:
+            findings.append(
+                Finding(
+                    field=spec.desc or spec.rule_id,
+                    message=spec.desc or spec.expr,
+                    severity=spec.severity,
+                    rule=spec.rule_id or "cross_rule",
                 )
+            )
     return findings
 
 
@@ -302,10 +505,8 @@ def _extract_alignment_sources(payload: dict[str, Any]) -> dict[str, dict[str, A
 def _normalize_for_compare(value: Any) -> Any:
     if isinstance(value, str):
         return value.strip().lower()
-    if isinstance(value, int | float | bool):
+    if value is None or isinstance(value, int | float | bool):
         return value
-    if value is None:
-        return None
     return str(value)
 
 
@@ -331,32 +532,40 @@ def _alignment_fields(registry: dict[str, Any]) -> list[str]:
     ]
 
 
-def _source_alignment_findings(payload: dict[str, Any], registry: dict[str, Any]) -> list[Finding]:
+def _source_alignment_findings(
+    payload: dict[str, Any], alignment_fields: tuple[RequirementPath, ...]
+) -> list[Finding]:
     sources = _extract_alignment_sources(payload)
     if not sources:
         return []
+    # Callers may pass one dict under several source names; compare each object once.
+    distinct = [payload, *{id(source): source for source in sources.values()}.values()]
 
     findings: list[Finding] = []
-    for field in _alignment_fields(registry):
-        values: dict[str, Any] = {"uad": _get_field(payload, field)}
-        for name, source_payload in sources.items():
-            values[name] = _get_field(source_payload, field)
-
-        non_missing = {
-            name: _normalize_for_compare(value)
-            for name, value in values.items()
-            if not _is_missing(value)
-        }
-        if len(non_missing) <= 1:
-            continue
-        unique_values = {val for val in non_missing.values()}
-        if len(unique_values) <= 1:
+    for field, parts in alignment_fields:
+        first: Any = _UNSET
+        differs = False
+        for document in distinct:
+            value = _get_field_parts(document, parts)
+            if _is_missing(value):
+                continue
+            normalized = _normalize_for_compare(value)
+            if first is _UNSET:
+                first = normalized
+            elif normalized != first:
+                differs = True
+                break
+        if not differs:
             continue
 
+        values: dict[str, Any] = {"uad": _get_field_parts(payload, parts)}
+        for name, source_payload in sources.items():
+            values[name] = _get_field_parts(source_payload, parts)
+        missing = {name: _is_missing(value) for name, value in values.items()}
         sources_detail = {
             name: {
-                "value": None if _is_missing(value) else value,
-                "missing": _is_missing(value),
+                "value": None if missing[name] else value,
+                "missing": missing[name],
             }
             for name, value in values.items()
         }
@@ -423,7 +632,7 @@ def _reconciliation_appraisal_type_findings(
     if not appraisal_type:
         return []
     lowered = appraisal_type.lower()
-    if lowered.startswith("as is") or lowered in {"as-is", "asis", "as is"}:
+    if lowered.startswith("as is") or lowered in _AS_IS_FORMS:
         return []
 
     escalated = bool(_get_field(payload, "review.escalated"))
@@ -471,8 +680,13 @@ def _comparable_condition_findings(rule: dict[str, Any], payload: dict[str, Any]
     if not comparable_with_rank:
         return []
 
-    mean, std_dev = condition_stats(rank for _, _, rank in comparable_with_rank)
+    ranks = [rank for _, _, rank in comparable_with_rank]
+    mean, std_dev = condition_stats(ranks)
     tolerance = 2 * std_dev
+    limit = tolerance + 1e-9
+    # The widest gap bounds every per-comparable delta, so most reports exit here.
+    if max(max(ranks) - subject_rank, subject_rank - min(ranks)) <= limit:
+        return []
     rule_id = rule.get("id", "R-13")
     severity = rule.get("severity", "error")
     desc = rule.get(
@@ -483,7 +697,7 @@ def _comparable_condition_findings(rule: dict[str, Any], payload: dict[str, Any]
     findings: list[Finding] = []
     for index, comparable, rank in comparable_with_rank:
         delta = abs(rank - subject_rank)
-        if delta > tolerance + 1e-9:
+        if delta > limit:
             identifier = comparable.get("id")
             if isinstance(identifier, str) and identifier.strip():
                 label = identifier.strip()
@@ -505,14 +719,7 @@ def _comparable_condition_findings(rule: dict[str, Any], payload: dict[str, Any]
     return findings
 
 
-def _signature_requirement_findings(
-    payload: dict[str, Any], requirements: dict[str, Any]
-) -> list[Finding]:
-    signature_present = _get_field(payload, "appraiser.signature_present")
-    signature_date = _get_field(payload, "appraiser.signature_date")
-    if not signature_present or _is_missing(signature_date):
-        return []
-
+def _compile_signature_paths(requirements: dict[str, Any]) -> tuple[RequirementPath, ...]:
     config = requirements.get("requirements", {}) if requirements else {}
     field_paths: list[str] = []
 
@@ -533,9 +740,27 @@ def _signature_requirement_findings(
                     if isinstance(path, str):
                         field_paths.append(path)
 
-    for field_path in field_paths:
-        value = _get_field(payload, field_path)
-        if _is_missing(value):
+    return tuple((path, tuple(path.split("."))) for path in field_paths)
+
+
+@lru_cache(maxsize=4)
+def _signature_paths(key: FileKey) -> tuple[RequirementPath, ...]:
+    return _compile_signature_paths(_load_json_cached(key))
+
+
+def _report_signed(payload: dict[str, Any]) -> bool:
+    """Signature and photo completeness rules only apply to signed, dated reports."""
+
+    if not _get_field(payload, "appraiser.signature_present"):
+        return False
+    return not _is_missing(_get_field(payload, "appraiser.signature_date"))
+
+
+def _signature_requirement_findings(
+    payload: dict[str, Any], field_paths: tuple[RequirementPath, ...]
+) -> list[Finding]:
+    for field_path, parts in field_paths:
+        if _field_missing(payload, parts):
             message = (
                 "Appraiser signature requires certifications, photo inventory, "
                 "and Sections A–D to be complete before finalizing the report. "
@@ -552,22 +777,14 @@ def _signature_requirement_findings(
     return []
 
 
-def _photo_inventory_findings(
-    payload: dict[str, Any], requirements: dict[str, Any]
-) -> list[Finding]:
-    signature_present = _get_field(payload, "appraiser.signature_present")
-    signature_date = _get_field(payload, "appraiser.signature_date")
-    if not signature_present or _is_missing(signature_date):
-        return []
-
+def _compile_photo_entries(requirements: dict[str, Any]) -> tuple[PhotoEntry, ...]:
     config = requirements.get("photos", {}) if requirements else {}
     if isinstance(config, list):
         photo_entries = config
     else:
         photo_entries = config.get("required", []) if isinstance(config, dict) else []
 
-    missing_codes: list[str] = []
-
+    compiled: list[PhotoEntry] = []
     for entry in photo_entries:
         if not isinstance(entry, dict):
             continue
@@ -575,18 +792,34 @@ def _photo_inventory_findings(
         payload_path = entry.get("payload_path") or entry.get("path")
         if not azure_code or not payload_path:
             continue
-        value = _get_field(payload, payload_path)
+        compiled.append((str(azure_code), tuple(str(payload_path).split("."))))
+    # Sorted up front so missing codes are collected already in message order.
+    compiled.sort(key=lambda entry: entry[0])
+    return tuple(compiled)
+
+
+@lru_cache(maxsize=4)
+def _photo_entries(key: FileKey) -> tuple[PhotoEntry, ...]:
+    return _compile_photo_entries(_load_json_cached(key))
+
+
+def _photo_inventory_findings(
+    payload: dict[str, Any], photo_entries: tuple[PhotoEntry, ...]
+) -> list[Finding]:
+    missing_codes: list[str] = []
+
+    for azure_code, parts in photo_entries:
+        value = _get_field_parts(payload, parts)
         if isinstance(value, bool):
             if not value:
-                missing_codes.append(str(azure_code))
+                missing_codes.append(azure_code)
             continue
         if _is_missing(value):
-            missing_codes.append(str(azure_code))
+            missing_codes.append(azure_code)
 
     if not missing_codes:
         return []
 
-    missing_codes.sort()
     missing_text = ", ".join(missing_codes)
     message = (
         "Photo inventory is incomplete for a signed report. "
@@ -602,34 +835,59 @@ def _photo_inventory_findings(
     ]
 
 
-def validate(payload: dict[str, Any], schema_path: str, registry_path: str) -> dict[str, Any]:
-    schema = _load_json(schema_path)
-    registry = _load_json(registry_path)
-    signature_requirements: dict[str, Any] = {}
-    try:
-        signature_requirements = _load_json(SIGNATURE_REQUIREMENTS_PATH)
-    except FileNotFoundError:
-        signature_requirements = {}
-    photo_requirements: dict[str, Any] = {}
+def _result(findings: list[Finding]) -> dict[str, Any]:
+    # Serialize and detect errors in the same pass over the findings.
+    serialized: list[dict[str, Any]] = []
+    has_error = False
+    for finding in findings:
+        serialized.append(finding.as_dict())
+        if finding.severity == "error":
+            has_error = True
+    return {
+        "status": "fail" if has_error else "pass",
+        "findings": serialized,
+        "ruleset_version": RULESET_VERSION,
+    }
+
+
+def _optional_file_key(path: str | Path) -> FileKey | None:
     try:
-        photo_requirements = _load_json(PHOTO_REQUIREMENTS_PATH)
+        return _file_key(path)
     except FileNotFoundError:
-        photo_requirements = {}
-    findings: list[Finding] = []
+        return None
 
-    findings.extend(_schema_findings(payload, schema))
 
-    context = {k: _to_attr(v) for k, v in payload.items()}
+def validate(
+    payload: dict[str, Any], schema_path: str, registry_path: str, *, fail_fast: bool = False
+) -> dict[str, Any]:
+    """Validate ``payload`` against the JSON schema and the registry rules.
 
-    findings.extend(_field_requirements(payload, registry, context))
-    findings.extend(_cross_rule_findings(payload, registry, context))
-    findings.extend(_source_alignment_findings(payload, registry))
-    findings.extend(_signature_requirement_findings(payload, signature_requirements))
-    findings.extend(_photo_inventory_findings(payload, photo_requirements))
+    With ``fail_fast`` set, at most ``FAIL_FAST_SCHEMA_ERRORS`` schema findings are collected
+    and the remaining rule passes are skipped once the schema has already failed the payload.
+    """
 
-    status = "fail" if any(f.severity == "error" for f in findings) else "pass"
-    return {
-        "status": status,
-        "findings": [f.as_dict() for f in findings],
-        "ruleset_version": RULESET_VERSION,
-    }
+    schema_validator = _schema_validator(_file_key(schema_path))
+    compiled = _compiled_registry(_file_key(registry_path))
+
+    findings = list(
+        _schema_findings(payload, schema_validator, FAIL_FAST_SCHEMA_ERRORS if fail_fast else None)
+    )
+    if fail_fast and findings:
+        return _result(findings)
+
+    # Attribute access in expressions resolves through dict.get, so the payload itself
+    # serves as the evaluation context without copying it.
+    context = payload
+
+    findings.extend(_field_requirements(payload, compiled.fields, context))
+    findings.extend(_cross_rule_findings(payload, compiled.cross_rules, context))
+    findings.extend(_source_alignment_findings(payload, compiled.alignment_fields))
+    if _report_signed(payload):
+        signature_key = _optional_file_key(SIGNATURE_REQUIREMENTS_PATH)
+        photo_key = _optional_file_key(PHOTO_REQUIREMENTS_PATH)
+        signature_paths = _signature_paths(signature_key) if signature_key else ()
+        photo_entries = _photo_entries(photo_key) if photo_key else ()
+        findings.extend(_signature_requirement_findings(payload, signature_paths))
+        findings.extend(_photo_inventory_findings(payload, photo_entries))
+
+    return _result(findings)
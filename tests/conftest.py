@@ -1,8 +1,57 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import Any
+
+import pytest
+from azure.ai.documentintelligence.models import AnalyzedDocument, AnalyzeResult
+from fastapi.testclient import TestClient
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(scope="session")
+def api_client() -> Iterator[TestClient]:
+    """One TestClient for the whole run; per-test stubs are applied with monkeypatch."""
+
+    from src.main import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+AnalyzeStub = Callable[[Callable[[bytes], AnalyzedDocument]], list[str]]
+
+
+@pytest.fixture
+def analyze_stub(monkeypatch: pytest.MonkeyPatch) -> AnalyzeStub:
+    """Route Azure analysis to ``document_for(pdf_bytes)``; returns the model IDs requested.
+
+    Exceptions raised by ``document_for`` surface from the analysis call, as Azure failures do.
+    """
+
+    def install(document_for: Callable[[bytes], AnalyzedDocument]) -> list[str]:
+        calls: list[str] = []
+
+        class StubPoller:
+            def __init__(self, model_id: str, document: AnalyzedDocument) -> None:
+                self._result = AnalyzeResult(
+                    api_version="2024-11-30", model_id=model_id, content="", documents=[document]
+                )
+
+            def result(self) -> AnalyzeResult:
+                return self._result
+
+        class StubClient:
+            def begin_analyze_document(self, *, model_id: str, body: Any) -> StubPoller:
+                calls.append(model_id)
+                return StubPoller(model_id, document_for(body.read()))
+
+        monkeypatch.setattr("src.uad.azure_extract._client", lambda: StubClient())
+        return calls
+
+    return install
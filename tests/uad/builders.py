@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import Any
 
+from azure.ai.documentintelligence.models import AnalyzedDocument, DocumentField
+
 SCHEMA_PATH = "schema/uad_1004_v1.json"
 REGISTRY_PATH = "registry/fields.json"
 
@@ -117,8 +118,19 @@ def signed_report_payload() -> dict[str, Any]:
     return payload
 
 
-def duplicate_payload(payload: dict[str, Any]) -> dict[str, Any]:
-    return deepcopy(payload)
+def findings_by_rule(result: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
+    """Bucket a validation result's findings by rule id in a single pass."""
+
+    grouped: dict[str, list[dict[str, Any]]] = {}
+    for finding in result["findings"]:
+        grouped.setdefault(finding["rule"], []).append(finding)
+    return grouped
+
+
+def index_by(findings: list[dict[str, Any]], key: str = "field") -> dict[Any, dict[str, Any]]:
+    """Index findings by ``key``; later findings win when values repeat."""
+
+    return {finding[key]: finding for finding in findings}
 
 
 def with_sources(
@@ -127,7 +139,8 @@ def with_sources(
     title: dict[str, Any] | None = None,
     public_records: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    enriched = duplicate_payload(payload)
+    """Return a shallow copy of ``payload`` with the given sources; nested dicts are shared."""
+
     sources: dict[str, Any] = {}
     if loan_docs is not None:
         sources["loan_docs"] = loan_docs
@@ -136,17 +149,28 @@ def with_sources(
     if public_records is not None:
         sources["public_records"] = public_records
     if sources:
-        enriched["sources"] = sources
-    return enriched
+        return {**payload, "sources": sources}
+    return {**payload}
 
 
 def sales_comparison_payload(
     payload: dict[str, Any], subject: dict[str, Any], comparables: list[dict[str, Any]]
 ) -> dict[str, Any]:
-    enriched = duplicate_payload(payload)
-    enriched.setdefault("sales_comparison", {})
-    enriched["sales_comparison"] = {
-        "subject": subject,
-        "comparables": comparables,
-    }
-    return enriched
+    """Return a shallow copy of ``payload`` with a sales comparison section."""
+
+    return {**payload, "sales_comparison": {"subject": subject, "comparables": comparables}}
+
+
+def subject_document(**subject_fields: DocumentField) -> AnalyzedDocument:
+    """Return a 1004 document whose ``Subject`` object holds ``subject_fields``."""
+
+    return AnalyzedDocument(
+        doc_type="mortgage.us.1004",
+        fields={"Subject": DocumentField(type="object", value_object=subject_fields)},
+    )
+
+
+def tax_year_document(tax_year: str = "2024") -> AnalyzedDocument:
+    """Return a 1004 document carrying only ``Subject.TaxYear``."""
+
+    return subject_document(TaxYear=DocumentField(type="string", value_string=tax_year))
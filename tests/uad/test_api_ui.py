@@ -1,19 +1,13 @@
 from __future__ import annotations
 
 import json
+from pathlib import Path
 
 import pytest
-from fastapi.testclient import TestClient
 
-from src.main import app
-
-
-@pytest.fixture(autouse=True)
-def _set_env(monkeypatch, tmp_path):
-    monkeypatch.setenv("AZURE_DOCINTEL_ENDPOINT", "https://example.com")
-    monkeypatch.setenv("AZURE_DOCINTEL_KEY", "key")
-    monkeypatch.setenv("AZURE_DOCINTEL_MODEL_ID", "test-model")
 
+@pytest.fixture(scope="module")
+def fallback_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
     fallback_payload = {
         "payload": {
             "subject": {
@@ -54,8 +48,16 @@ def _set_env(monkeypatch, tmp_path):
         "model_id": "fallback-ui-test",
         "fallback_used": True,
     }
-    fallback_path = tmp_path / "fallback_ui.json"
-    fallback_path.write_text(json.dumps(fallback_payload), encoding="utf-8")
+    path = tmp_path_factory.mktemp("fallback") / "fallback_ui.json"
+    path.write_text(json.dumps(fallback_payload), encoding="utf-8")
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch, fallback_path):
+    monkeypatch.setenv("AZURE_DOCINTEL_ENDPOINT", "https://example.com")
+    monkeypatch.setenv("AZURE_DOCINTEL_KEY", "key")
+    monkeypatch.setenv("AZURE_DOCINTEL_MODEL_ID", "test-model")
     monkeypatch.setenv("AZURE_DOCINTEL_FALLBACK_JSON", str(fallback_path))
 
     class DummyClient:
@@ -65,20 +67,18 @@ def _set_env(monkeypatch, tmp_path):
     monkeypatch.setattr("src.uad.azure_extract._client", lambda: DummyClient())
 
 
-def test_index_route_serves_html():
-    client = TestClient(app)
-    response = client.get("/")
+def test_index_route_serves_html(api_client):
+    response = api_client.get("/")
     assert response.status_code == 200
     assert "Form 1004 Analysis Suite" in response.text
 
 
-def test_validate_endpoint_returns_fallback(tmp_path):
-    client = TestClient(app)
+def test_validate_endpoint_returns_fallback(api_client, tmp_path):
     pdf_path = tmp_path / "document.pdf"
     pdf_path.write_bytes(b"%PDF-1.4\\n% fallback demo\\n")
     with pdf_path.open("rb") as handle:
         files = {"file": ("document.pdf", handle, "application/pdf")}
-        response = client.post("/uad/validate", files=files)
+        response = api_client.post("/uad/validate", files=files)
     assert response.status_code == 200
     payload = response.json()
     assert payload["fallback_used"] is True
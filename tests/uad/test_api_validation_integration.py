@@ -6,16 +6,17 @@ from typing import Any, TypeAlias
 import pytest
 from fastapi.testclient import TestClient
 
-from src.main import app
 from src.uad.azure_extract import ExtractionResult
 
 from .builders import base_payload, signed_report_payload
 
+_PDF_BYTES = b"%PDF-1.4\n% integration test payload\n"
+
 ClientWithStub: TypeAlias = tuple[TestClient, dict[str, ExtractionResult]]
 
 
 @pytest.fixture
-def client(monkeypatch: pytest.MonkeyPatch) -> ClientWithStub:
+def client(monkeypatch: pytest.MonkeyPatch, api_client: TestClient) -> ClientWithStub:
     result_holder: dict[str, ExtractionResult] = {}
 
     def _fake_extract(_: str) -> ExtractionResult:
@@ -24,7 +25,7 @@ def client(monkeypatch: pytest.MonkeyPatch) -> ClientWithStub:
         return result_holder["result"]
 
     monkeypatch.setattr("src.api.uad.extract_1004_fields", _fake_extract)
-    return TestClient(app), result_holder
+    return api_client, result_holder
 
 
 def _make_result(payload: dict[str, Any], *, fallback_used: bool = False) -> ExtractionResult:
@@ -41,11 +42,9 @@ def _make_result(payload: dict[str, Any], *, fallback_used: bool = False) -> Ext
 
 
 def _post_pdf(client: TestClient) -> dict[str, Any]:
-    file = BytesIO(b"%PDF-1.4\n% integration test payload\n")
-    file.seek(0)
     response = client.post(
         "/uad/validate",
-        files={"file": ("report.pdf", file, "application/pdf")},
+        files={"file": ("report.pdf", BytesIO(_PDF_BYTES), "application/pdf")},
     )
     assert response.status_code == 200
     return response.json()
@@ -60,9 +59,10 @@ def test_validate_endpoint_reports_rule_hits(client: ClientWithStub) -> None:
     payload = _post_pdf(client_app)
 
     assert payload["status"] == "fail"
-    requirement_findings = [f for f in payload["findings"] if f["rule"] == "uad_requirement"]
-    assert requirement_findings
-    assert any(f["field"] == "contract.contract_price" for f in requirement_findings)
+    assert any(
+        f["rule"] == "uad_requirement" and f["field"] == "contract.contract_price"
+        for f in payload["findings"]
+    )
 
 
 def test_validate_endpoint_reports_pass_snapshot(client: ClientWithStub) -> None:
@@ -72,5 +72,5 @@ def test_validate_endpoint_reports_pass_snapshot(client: ClientWithStub) -> None
     payload = _post_pdf(client_app)
 
     assert payload["status"] == "pass"
-    assert not [f for f in payload["findings"] if f["severity"] == "error"]
+    assert not any(f["severity"] == "error" for f in payload["findings"])
     assert payload["fallback_used"] is False
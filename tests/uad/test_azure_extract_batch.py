@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import json
+
+from src.uad.azure_extract import extract_1004_fields_batch
+
+from .builders import tax_year_document
+
+
+def test_batch_extraction_preserves_order_and_falls_back_per_document(
+    tmp_path, monkeypatch, analyze_stub
+):
+    fallback_path = tmp_path / "fallback.json"
+    fallback_path.write_text(
+        json.dumps({"payload": {"subject": {"tax_year": "fallback"}}}), encoding="utf-8"
+    )
+    monkeypatch.setenv("AZURE_DOCINTEL_FALLBACK_JSON", str(fallback_path))
+
+    paths = []
+    for name in ("2021", "broken", "2023"):
+        pdf_path = tmp_path / f"{name}.pdf"
+        pdf_path.write_bytes(name.encode("utf-8"))
+        paths.append(str(pdf_path))
+
+    def document_for(data: bytes):
+        if data == b"broken":
+            raise RuntimeError("boom")
+        return tax_year_document(data.decode("utf-8"))
+
+    analyze_stub(document_for)
+
+    results = extract_1004_fields_batch(paths, "model-id", max_in_flight=2)
+
+    assert [r.payload["subject"]["tax_year"] for r in results] == ["2021", "fallback", "2023"]
+    assert [r.fallback_used for r in results] == [False, True, False]
+
+
+def test_batch_extraction_handles_empty_input():
+    assert extract_1004_fields_batch([]) == []
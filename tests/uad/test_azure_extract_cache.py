@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+
+from src.uad.azure_extract import _write_cache, extract_1004_fields
+
+from .builders import tax_year_document
+
+
+def test_extraction_cache_reuses_analysis_for_identical_pdf(tmp_path, monkeypatch, analyze_stub):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("AZURE_DOCINTEL_CACHE_DIR", str(cache_dir))
+    pdf_path = tmp_path / "input.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n%cached document\n")
+    calls = analyze_stub(lambda data: tax_year_document())
+
+    first = extract_1004_fields(str(pdf_path), "model-id")
+    second = extract_1004_fields(str(pdf_path), "model-id")
+
+    assert calls == ["model-id"]
+    assert len(list(cache_dir.glob("model-id_*.json"))) == 1
+    assert first.payload["subject"]["tax_year"] == "2024"
+    assert second.payload == first.payload
+    assert second.raw_fields == first.raw_fields
+    assert second.fallback_used is False
+
+
+def test_extraction_cache_is_keyed_by_model(tmp_path, monkeypatch, analyze_stub):
+    monkeypatch.setenv("AZURE_DOCINTEL_CACHE_DIR", str(tmp_path / "cache"))
+    pdf_path = tmp_path / "input.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n%cached document\n")
+    calls = analyze_stub(lambda data: tax_year_document())
+
+    extract_1004_fields(str(pdf_path), "model-a")
+    extract_1004_fields(str(pdf_path), "model-b")
+
+    assert calls == ["model-a", "model-b"]
+
+
+def test_extraction_cache_discards_unreadable_entry(tmp_path, monkeypatch, analyze_stub):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("AZURE_DOCINTEL_CACHE_DIR", str(cache_dir))
+    pdf_path = tmp_path / "input.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n%cached document\n")
+    calls = analyze_stub(lambda data: tax_year_document())
+    extract_1004_fields(str(pdf_path), "model-id")
+    (entry,) = cache_dir.glob("model-id_*.json")
+    entry.write_text("{trunc", encoding="utf-8")
+
+    result = extract_1004_fields(str(pdf_path), "model-id")
+
+    assert calls == ["model-id", "model-id"]
+    assert result.fallback_used is False
+    assert result.payload["subject"]["tax_year"] == "2024"
+    assert entry.read_bytes() != b"{trunc"
+
+
+def test_concurrent_cache_writes_for_one_key_leave_a_complete_entry(tmp_path, monkeypatch, caplog):
+    path = tmp_path / "cache" / "model-id_digest.json"
+    # Hold both writers at the rename so their temp files are written side by side.
+    barrier = threading.Barrier(2, timeout=5)
+    replace = os.replace
+
+    def replace_after_both_wrote(src, dst):
+        barrier.wait()
+        replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", replace_after_both_wrote)
+
+    class Result:
+        def __init__(self, tag: str) -> None:
+            self.tag = tag
+
+        def as_dict(self) -> dict[str, str]:
+            return {"tag": self.tag}
+
+    threads = [
+        threading.Thread(target=_write_cache, args=(path, Result(tag))) for tag in ("a", "b")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert json.loads(path.read_text(encoding="utf-8"))["tag"] in {"a", "b"}
+    assert list(path.parent.glob("*.tmp")) == []
+    assert "Unable to write" not in caplog.text
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from azure.ai.documentintelligence.models import AnalyzedDocument, DocumentField
+
+from src.uad.azure_extract import extract_1004_fields
+
+from .builders import subject_document
+
+
+def _document() -> AnalyzedDocument:
+    return subject_document(
+        TaxYear=DocumentField(type="string", value_string="2024", confidence=0.4),
+        HoaPaymentInterval=DocumentField(type="string", content="(None Selected)", confidence=0.9),
+    )
+
+
+def test_extract_collects_diagnostics_by_default(tmp_path, analyze_stub):
+    pdf_path = tmp_path / "input.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n%mock document\n")
+    analyze_stub(lambda data: _document())
+
+    result = extract_1004_fields(str(pdf_path), "model-id")
+
+    assert result.payload["subject"]["tax_year"] == "2024"
+    assert "Subject.TaxYear" in result.raw_fields
+    assert result.low_confidence_fields == ["Subject.TaxYear"]
+    assert result.business_flags[0]["field"] == "Subject.HoaPaymentInterval"
+
+
+def test_extract_skips_diagnostics_when_disabled(tmp_path, analyze_stub):
+    pdf_path = tmp_path / "input.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n%mock document\n")
+    analyze_stub(lambda data: _document())
+
+    result = extract_1004_fields(str(pdf_path), "model-id", diagnostics=False)
+
+    assert result.payload["subject"]["tax_year"] == "2024"
+    assert result.raw_payload["subject"]["TaxYear"] == "2024"
+    assert result.raw_fields == {}
+    assert result.missing_fields == []
+    assert result.low_confidence_fields == []
+    assert result.business_flags == []
@@ -1,76 +1,93 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 import pytest
 
-from src.uad.azure_extract import ExtractionResult, extract_1004_fields
+from src.uad.azure_extract import ExtractionResult, _load_fallback, extract_1004_fields
 
-
-@pytest.mark.parametrize("fallback_env", [True, False])
-def test_extract_uses_fallback_when_azure_fails(tmp_path, monkeypatch, fallback_env):
-    payload = {
-        "payload": {
-            "subject": {
-                "address": {
-                    "street": "100 Test St",
-                    "city": "Austin",
-                    "state": "TX",
-                    "zip": "78701",
-                },
-                "pud_indicator": False,
-                "borrower_name": "Jordan Borrower",
-                "public_record_owner": "Jordan Borrower",
-            },
-            "contract": {"assignment_type": "Purchase"},
-            "appraiser": {
-                "name": "Taylor Appraiser",
-                "phone": "512-555-0184",
+_PAYLOAD: dict[str, Any] = {
+    "payload": {
+        "subject": {
+            "address": {
+                "street": "100 Test St",
+                "city": "Austin",
+                "state": "TX",
+                "zip": "78701",
             },
+            "pud_indicator": False,
+            "borrower_name": "Jordan Borrower",
+            "public_record_owner": "Jordan Borrower",
         },
-        "raw_fields": {
-            "Subject.PropertyAddress.street": {
-                "type": "string",
-                "value": "100 Test St",
-                "content": "100 Test St",
-                "confidence": 0.93,
-                "leaf": True,
-            },
-            "Subject.HoaPaymentInterval": {
-                "type": "selectionGroup",
-                "value": "(None Selected)",
-                "content": "(None Selected)",
-                "confidence": 0.45,
-                "leaf": True,
-            },
+        "contract": {"assignment_type": "Purchase"},
+        "appraiser": {
+            "name": "Taylor Appraiser",
+            "phone": "512-555-0184",
         },
-        "missing_fields": [],
-        "low_confidence_fields": ["Subject.HoaPaymentInterval"],
-        "business_flags": [
-            {
-                "field": "Subject.HoaPaymentInterval",
-                "issue": "none_selected",
-                "message": "Azure Document Intelligence returned '(None Selected)' for this field.",
-            }
-        ],
-        "model_id": "fallback-test",
-        "fallback_used": True,
-        "raw_payload": {
-            "subject": {"AssessorParcelNumber": "100-ABC"},
-            "photos": {"FrontExterior": {"Caption": "Front"}},
+    },
+    "raw_fields": {
+        "Subject.PropertyAddress.street": {
+            "type": "string",
+            "value": "100 Test St",
+            "content": "100 Test St",
+            "confidence": 0.93,
+            "leaf": True,
         },
-    }
-    fallback_path = tmp_path / "fallback.json"
-    fallback_path.write_text(json.dumps(payload), encoding="utf-8")
-
+        "Subject.HoaPaymentInterval": {
+            "type": "selectionGroup",
+            "value": "(None Selected)",
+            "content": "(None Selected)",
+            "confidence": 0.45,
+            "leaf": True,
+        },
+    },
+    "missing_fields": [],
+    "low_confidence_fields": ["Subject.HoaPaymentInterval"],
+    "business_flags": [
+        {
+            "field": "Subject.HoaPaymentInterval",
+            "issue": "none_selected",
+            "message": "Azure Document Intelligence returned '(None Selected)' for this field.",
+        }
+    ],
+    "model_id": "fallback-test",
+    "fallback_used": True,
+    "raw_payload": {
+        "subject": {"AssessorParcelNumber": "100-ABC"},
+        "photos": {"FrontExterior": {"Caption": "Front"}},
+    },
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def azure_env() -> Iterator[None]:
     # Required env vars for client factory
-    monkeypatch.setenv("AZURE_DOCINTEL_ENDPOINT", "https://example.com")
-    monkeypatch.setenv("AZURE_DOCINTEL_KEY", "key")
-    monkeypatch.setenv("AZURE_DOCINTEL_MODEL_ID", "model-id")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("AZURE_DOCINTEL_ENDPOINT", "https://example.com")
+        mp.setenv("AZURE_DOCINTEL_KEY", "key")
+        mp.setenv("AZURE_DOCINTEL_MODEL_ID", "model-id")
+        yield
+
+
+@pytest.fixture(scope="module")
+def pdf_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("pdf") / "input.pdf"
+    path.write_bytes(b"%PDF-1.4\n%mock document\n")
+    return path
+
 
-    pdf_path = tmp_path / "input.pdf"
-    pdf_path.write_bytes(b"%PDF-1.4\\n%mock document\\n")
+@pytest.fixture(scope="module")
+def fallback_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("fallback") / "fallback.json"
+    path.write_text(json.dumps(_PAYLOAD), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("fallback_env", [True, False])
+def test_extract_uses_fallback_when_azure_fails(monkeypatch, fallback_env, pdf_path, fallback_path):
 
     class DummyClient:
         def begin_analyze_document(self, *args, **kwargs):
@@ -86,23 +103,17 @@ def test_extract_uses_fallback_when_azure_fails(tmp_path, monkeypatch, fallback_
     result = extract_1004_fields(str(pdf_path))
     assert isinstance(result, ExtractionResult)
     assert result.fallback_used is True
-    assert result.payload == payload["payload"]
+    assert result.payload == _PAYLOAD["payload"]
     assert result.raw_fields["Subject.PropertyAddress.street"]["value"] == "100 Test St"
     assert result.business_flags[0]["issue"] == "none_selected"
-    assert "raw_payload" in payload
-    assert result.raw_payload == payload["raw_payload"]
+    assert "raw_payload" in _PAYLOAD
+    assert result.raw_payload == _PAYLOAD["raw_payload"]
 
 
-def test_extract_surfaces_extended_sections(tmp_path, monkeypatch):
+def test_extract_surfaces_extended_sections(monkeypatch, pdf_path):
     fallback_path = Path(__file__).resolve().parents[2] / "samples" / "fallback_extract.json"
-    monkeypatch.setenv("AZURE_DOCINTEL_ENDPOINT", "https://example.com")
-    monkeypatch.setenv("AZURE_DOCINTEL_KEY", "key")
-    monkeypatch.setenv("AZURE_DOCINTEL_MODEL_ID", "model-id")
     monkeypatch.setenv("AZURE_DOCINTEL_FALLBACK_JSON", str(fallback_path))
 
-    pdf_path = tmp_path / "input.pdf"
-    pdf_path.write_bytes(b"%PDF-1.4\n%mock document\n")
-
     class DummyClient:
         def begin_analyze_document(self, *args, **kwargs):
             raise RuntimeError("boom")
@@ -128,3 +139,18 @@ def test_extract_surfaces_extended_sections(tmp_path, monkeypatch):
     assert result.payload["loan"]["loan_number"] == "LN-445566"
     assert result.payload["title"]["current_owner"] == "Alex Borrower"
     assert result.raw_payload["sales_comparison"]["Comparables"][0]["Identifier"] == "Comp1"
+
+
+def test_fallback_results_do_not_share_state(tmp_path, monkeypatch):
+    fallback_path = tmp_path / "fallback.json"
+    fallback_path.write_text(json.dumps({"payload": {"contract": {}}}), encoding="utf-8")
+    monkeypatch.setenv("AZURE_DOCINTEL_FALLBACK_JSON", str(fallback_path))
+
+    first = _load_fallback("model-id")
+    first.payload["contract"]["id"] = "mutated"
+    second = _load_fallback("model-id")
+    assert second.payload == {"contract": {}}
+    assert second.payload is not first.payload
+
+    fallback_path.write_text(json.dumps({"payload": {"contract": {"id": 1}}}), encoding="utf-8")
+    assert _load_fallback("model-id").payload == {"contract": {"id": 1}}
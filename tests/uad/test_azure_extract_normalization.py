@@ -15,3 +15,8 @@ def test_normalize_appraisal_type_subject_to_variants() -> None:
 def test_normalize_appraisal_type_passthrough() -> None:
     assert _normalize_appraisal_type("Desktop") == "Desktop"
     assert _normalize_appraisal_type(None) is None
+
+
+def test_normalize_appraisal_type_only_maps_known_as_is_forms() -> None:
+    assert _normalize_appraisal_type("As is, subject to repairs") == "As is, subject to repairs"
+    assert _normalize_appraisal_type("   ") is None
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import statistics
+
+import pytest
+
+from src.uad.conditions import (
+    CONDITION_RANKS,
+    condition_rank,
+    condition_stats,
+    normalize_condition_code,
+)
+
+
+def test_condition_stats_matches_population_statistics() -> None:
+    ranks = [1, 2, 3, 6]
+    mean, std_dev = condition_stats(iter(ranks))
+    assert mean == statistics.fmean(ranks)
+    assert abs(std_dev - statistics.pstdev(ranks)) < 1e-12
+
+
+def test_condition_stats_handles_empty_and_single_values() -> None:
+    assert condition_stats([]) == (0.0, 0.0)
+    assert condition_stats([4]) == (4.0, 0.0)
+
+
+@pytest.mark.parametrize("value", [" c4 ", "Condition C2", "C6", "C7", "c0", "", "Good"])
+def test_condition_rank_matches_normalized_code(value: str) -> None:
+    code = normalize_condition_code(value)
+    expected = CONDITION_RANKS[code] if code is not None else None
+    assert condition_rank(value) == expected
@@ -2,13 +2,21 @@ from __future__ import annotations
 
 from datetime import date as dt_date
 
-from azure.ai.documentintelligence.models import AddressValue, CurrencyValue, DocumentField
+from azure.ai.documentintelligence.models import (
+    AddressValue,
+    AnalyzedDocument,
+    CurrencyValue,
+    DocumentField,
+)
 
 from src.uad.azure_extract import (
     _addr_split,
     _bool_from_field,
     _date_mmddyyyy,
+    _dom,
+    _field_by_path,
     _hoa_freq,
+    _index_fields,
     _money_to_int,
     _pick_selected_label,
 )
@@ -58,3 +66,40 @@ def test_date_mmddyyyy_from_date():
 def test_bool_from_field_handles_yes_string():
     field = DocumentField(type="string", value_string="Yes")
     assert _bool_from_field(field) is True
+    assert _bool_from_field(DocumentField(type="string", value_string="N")) is False
+    assert _bool_from_field(DocumentField(type="string", value_string="Maybe")) is None
+
+
+def test_pick_selected_label_falls_back_to_content():
+    field = DocumentField(type="selectionGroup", value_selection_group=[" "], content=" No ")
+    assert _pick_selected_label(field) == "No"
+    assert _bool_from_field(field) is False
+
+
+def test_index_fields_matches_field_by_path():
+    street = DocumentField(type="string", value_string="1 Elm St")
+    address = DocumentField(type="object", value_object={"street": street})
+    doc = AnalyzedDocument(
+        doc_type="mortgage.us.1004",
+        fields={"Subject": DocumentField(type="object", value_object={"Address": address})},
+    )
+    index = _index_fields(doc.fields)
+    for path in ("Subject", "Subject.Address", "Subject.Address.street"):
+        assert index[path] == _field_by_path(doc, path)
+    assert index.get("Subject.Missing") is None
+
+
+def test_digit_extraction_helpers():
+    assert _dom("Unknown") == "Unk"
+    assert _dom("45 days") == "45"
+    assert _dom("n/a") is None
+    field = DocumentField(type="string", value_string="approx. 12 500 USD")
+    assert _money_to_int(field) == 12500
+    field = DocumentField(type="string", value_string="$ 412,500.40")
+    assert _money_to_int(field) == 412500
+
+
+def test_date_mmddyyyy_from_text():
+    field = DocumentField(type="string", value_string="4-5-24")
+    assert _date_mmddyyyy(field) == "04/05/2024"
+    assert _date_mmddyyyy(DocumentField(type="string", value_string="April 5")) is None
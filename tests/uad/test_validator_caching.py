@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import json
+import os
+
+from src.uad.validator import _load_json, validate
+
+from .builders import REGISTRY_PATH, SCHEMA_PATH, base_payload
+
+
+def test_load_json_reuses_parsed_document() -> None:
+    assert _load_json(SCHEMA_PATH) is _load_json(SCHEMA_PATH)
+
+
+def test_registry_cache_refreshes_when_file_changes(tmp_path) -> None:
+    registry = _load_json(REGISTRY_PATH)
+    registry_path = tmp_path / "fields.json"
+    registry_path.write_text(json.dumps({"fields": []}), encoding="utf-8")
+
+    payload = base_payload()
+    payload["contract"].pop("contract_price")
+    assert validate(payload, SCHEMA_PATH, str(registry_path))["status"] == "pass"
+
+    registry_path.write_text(json.dumps(registry), encoding="utf-8")
+    stat = registry_path.stat()
+    os.utime(registry_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert validate(payload, SCHEMA_PATH, str(registry_path))["status"] == "fail"
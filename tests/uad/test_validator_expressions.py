@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import ast
+from typing import Any
+
+import pytest
+
+from src.uad import validator
+from src.uad.validator import _compile_expr, _compile_registry, _cross_rule_findings, _safe_eval
+
+
+def test_safe_eval_normalizes_json_literals() -> None:
+    context = {"subject": {"pud_indicator": True, "hoa_amount": None}}
+    assert _safe_eval("subject.pud_indicator == TRUE", context) is True
+    assert _safe_eval("subject.hoa_amount == null", context) is True
+    assert _safe_eval("subject.pud_indicator == false", context) is False
+
+
+def test_compile_expr_reuses_parsed_tree() -> None:
+    first = _compile_expr("contract.assignment_type == 'Purchase'")
+    second = _compile_expr("contract.assignment_type == 'Purchase'")
+    assert first is not None
+    assert first is second
+
+
+def test_safe_eval_rejects_invalid_syntax() -> None:
+    assert _compile_expr("subject.pud_indicator ==") is None
+    assert _safe_eval("subject.pud_indicator ==", {}) is False
+
+
+def test_compile_registry_splits_implications() -> None:
+    registry = {
+        "cross_rules": [
+            {"id": "X1", "expr": "subject.pud_indicator == true -> subject.hoa_amount != null"},
+            {"id": "X2", "expr": "contract.contract_price != null"},
+        ]
+    }
+    implication, plain = _compile_registry(registry).cross_rules
+    assert implication.implication is True
+    assert implication.antecedent is _compile_expr("subject.pud_indicator == true")
+    assert implication.consequent is _compile_expr("subject.hoa_amount != null")
+    assert plain.implication is False
+    assert plain.antecedent is None
+    assert plain.consequent is _compile_expr("contract.contract_price != null")
+
+
+def test_safe_eval_reads_nested_payload_without_wrapping() -> None:
+    payload = {
+        "subject": {"address": {"state": "CO"}},
+        "sales_comparison": {"comparables": [{"condition": "C3"}]},
+    }
+    assert _safe_eval("subject.address.state == 'CO'", payload) is True
+    assert _safe_eval("subject.missing.value == null", payload) is True
+    assert _safe_eval("sales_comparison.comparables[0].condition == 'C3'", payload) is True
+
+
+def test_compile_registry_pre_splits_field_paths() -> None:
+    registry = {
+        "fields": [
+            {"code": "subject.address.street", "uad": "Requirement"},
+            {"uad": "Requirement"},
+            {
+                "code": "contract.contract_price",
+                "uad": "Requirement",
+                "required_when": "contract.assignment_type == 'Purchase'",
+            },
+        ]
+    }
+    street, price = _compile_registry(registry).fields
+    assert street.parts == ("subject", "address", "street")
+    assert street.condition is None
+    assert street.always_required and street.severity == "error"
+    assert not price.always_required
+    assert price.parts == ("contract", "contract_price")
+    assert price.condition is _compile_expr("contract.assignment_type == 'Purchase'")
+
+
+def test_safe_eval_rejects_unsupported_nodes() -> None:
+    context = {"subject": {"real_estate_taxes": 10}}
+    assert _safe_eval("-subject.real_estate_taxes == -10", context) is False
+    assert _safe_eval("subject.real_estate_taxes + 1 == 11", context) is False
+    assert _compile_expr("subject.real_estate_taxes == 10 or len(subject) == 1") is None
+    assert _safe_eval("not subject.missing and subject.real_estate_taxes in [10, 20]", context)
+
+
+def test_cross_rules_share_antecedent_evaluation(monkeypatch: pytest.MonkeyPatch) -> None:
+    registry = {
+        "cross_rules": [
+            {"id": "A", "expr": "subject.pud_indicator == true -> subject.hoa_amount != null"},
+            {"id": "B", "expr": "subject.pud_indicator == true -> subject.hoa_frequency != null"},
+        ]
+    }
+    calls: list[ast.AST | None] = []
+    original = validator._eval_compiled
+
+    def counting(node: ast.AST | None, context: dict[str, Any]) -> bool:
+        calls.append(node)
+        return original(node, context)
+
+    monkeypatch.setattr(validator, "_eval_compiled", counting)
+    payload: dict[str, Any] = {"subject": {"pud_indicator": True}}
+    findings = _cross_rule_findings(payload, _compile_registry(registry).cross_rules, payload)
+
+    assert [f.rule for f in findings] == ["A", "B"]
+    assert calls.count(_compile_expr("subject.pud_indicator == true")) == 1
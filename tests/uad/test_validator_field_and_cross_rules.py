@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from src.uad.validator import validate
+from src.uad.validator import FAIL_FAST_SCHEMA_ERRORS, validate
 
 from .builders import REGISTRY_PATH, SCHEMA_PATH, base_payload, refinance_payload
 
@@ -73,3 +73,29 @@ def test_cross_rule_passes_when_hoa_frequency_present() -> None:
     result = validate(payload, SCHEMA_PATH, REGISTRY_PATH)
 
     assert not _findings(result, "X002")
+
+
+def test_fail_fast_stops_after_schema_errors() -> None:
+    payload = base_payload()
+    payload["contract"].pop("contract_price")
+    payload["sales_comparison"] = {
+        "comparables": [{"sale_price": "n/a"} for _ in range(FAIL_FAST_SCHEMA_ERRORS + 5)]
+    }
+
+    full = validate(payload, SCHEMA_PATH, REGISTRY_PATH)
+    fast = validate(payload, SCHEMA_PATH, REGISTRY_PATH, fail_fast=True)
+
+    assert _findings(full, "uad_requirement")
+    assert fast["status"] == "fail"
+    assert {f["rule"] for f in fast["findings"]} == {"schema"}
+    assert len(_findings(full, "schema")) == FAIL_FAST_SCHEMA_ERRORS + 5
+    assert len(fast["findings"]) == FAIL_FAST_SCHEMA_ERRORS
+
+
+def test_fail_fast_runs_rules_when_schema_passes() -> None:
+    payload = base_payload()
+    payload["contract"].pop("contract_price")
+
+    result = validate(payload, SCHEMA_PATH, REGISTRY_PATH, fail_fast=True)
+
+    assert [f["field"] for f in _findings(result, "uad_requirement")] == ["contract.contract_price"]
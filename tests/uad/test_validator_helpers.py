@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from src.uad.validator import (
+    _compile_photo_entries,
+    _compile_signature_paths,
+    _field_missing,
+    _get_field_parts,
+    _is_missing,
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, True),
+        ("", True),
+        ("   ", True),
+        ("\t\n", True),
+        (" x ", False),
+        ("x  ", False),
+        ([], True),
+        ({}, True),
+        ([None], False),
+        ({"a": 1}, False),
+        (0, False),
+        (False, False),
+    ],
+)
+def test_is_missing(value, expected) -> None:
+    assert _is_missing(value) is expected
+
+
+def test_compile_signature_paths_orders_and_splits_entries() -> None:
+    requirements = {
+        "requirements": {
+            "certifications": ["certifications.appraiser.name", 3],
+            "photos": ["photos.front_exterior.caption"],
+            "sections": {
+                "section_b": ["sections.section_b.title"],
+                "section_a": ["sections.section_a.title", None],
+            },
+        }
+    }
+    assert _compile_signature_paths(requirements) == (
+        ("certifications.appraiser.name", ("certifications", "appraiser", "name")),
+        ("photos.front_exterior.caption", ("photos", "front_exterior", "caption")),
+        ("sections.section_a.title", ("sections", "section_a", "title")),
+        ("sections.section_b.title", ("sections", "section_b", "title")),
+    )
+    assert _compile_signature_paths({}) == ()
+
+
+def test_compile_photo_entries_sorts_and_skips_incomplete() -> None:
+    requirements = {
+        "photos": {
+            "required": [
+                {"azure_code": "Photos.Rear", "payload_path": "photos.rear_exterior.present"},
+                {"azure": "Photos.Front", "path": "photos.front_exterior.present"},
+                {"azure_code": "Photos.Kitchen"},
+                "Photos.Street",
+            ]
+        }
+    }
+    assert _compile_photo_entries(requirements) == (
+        ("Photos.Front", ("photos", "front_exterior", "present")),
+        ("Photos.Rear", ("photos", "rear_exterior", "present")),
+    )
+    assert _compile_photo_entries({}) == ()
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {},
+        {"a": None},
+        {"a": "x"},
+        {"a": {"b": "  "}},
+        {"a": {"b": []}},
+        {"a": {"b": 0}},
+        {"a": {"b": "value"}},
+        {"a": {"b": {"c": 1}}},
+    ],
+)
+def test_field_missing_matches_get_and_check(payload: dict[str, Any]) -> None:
+    parts = ("a", "b")
+    assert _field_missing(payload, parts) is _is_missing(_get_field_parts(payload, parts))
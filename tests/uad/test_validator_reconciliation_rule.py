@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import Any
 
 from src.uad.validator import validate
@@ -16,13 +15,17 @@ def _findings(result: dict[str, Any]) -> list[dict[str, Any]]:
     return [f for f in result["findings"] if f["rule"] == "R-12"]
 
 
+def _has_finding(result: dict[str, Any]) -> bool:
+    return any(f["rule"] == "R-12" for f in result["findings"])
+
+
 def test_reconciliation_rule_allows_as_is() -> None:
     payload = base_payload()
     payload["reconciliation"] = {"appraisal_type": "As is"}
 
     result = _evaluate(payload)
 
-    assert _findings(result) == []
+    assert not _has_finding(result)
 
 
 def test_reconciliation_rule_flags_subject_to_without_review() -> None:
@@ -39,7 +42,7 @@ def test_reconciliation_rule_flags_subject_to_without_review() -> None:
 
 
 def test_reconciliation_rule_skips_when_escalated() -> None:
-    payload = deepcopy(base_payload())
+    payload = base_payload()
     payload["reconciliation"] = {
         "appraisal_type": "Subject to completion per plans",
     }
@@ -47,4 +50,4 @@ def test_reconciliation_rule_skips_when_escalated() -> None:
 
     result = _evaluate(payload)
 
-    assert _findings(result) == []
+    assert not _has_finding(result)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from src.uad.validator import validate
 
-from .builders import REGISTRY_PATH, SCHEMA_PATH, base_payload
+from .builders import REGISTRY_PATH, SCHEMA_PATH, base_payload, index_by
 
 
 def test_alignment_passes_when_sources_match() -> None:
@@ -28,6 +28,17 @@ def test_alignment_passes_when_sources_match() -> None:
     assert result["status"] == "pass"
 
 
+def test_alignment_flags_uad_against_aliased_sources() -> None:
+    payload = base_payload()
+    shared = {"subject": {"borrower_name": "Jordan Lee"}}
+    payload["sources"] = {"loan_docs": shared, "title": shared}
+
+    result = validate(payload, SCHEMA_PATH, REGISTRY_PATH)
+    findings = [f for f in result["findings"] if f["rule"] == "R-06"]
+    assert [f["field"] for f in findings] == ["subject.borrower_name"]
+    assert set(findings[0]["sources"]) == {"uad", "loan_docs", "title"}
+
+
 def test_alignment_flags_each_field_mismatch() -> None:
     payload = base_payload()
     payload["sources"] = {
@@ -77,17 +88,18 @@ def test_alignment_flags_each_field_mismatch() -> None:
 
     result = validate(payload, SCHEMA_PATH, REGISTRY_PATH)
     findings = [f for f in result["findings"] if f["rule"] == "R-06"]
-    assert {f["field"] for f in findings} == {
+    by_field = index_by(findings)
+    assert by_field.keys() == {
         "subject.address.street",
         "subject.borrower_name",
         "subject.public_record_owner",
     }
     assert all(f["severity"] == "error" for f in findings)
-    street_finding = next(f for f in findings if f["field"] == "subject.address.street")
+    street_finding = by_field["subject.address.street"]
     assert "Loan docs" in street_finding["message"]
     assert street_finding["sources"]["title"]["value"] == "12 Diverge Ave"
-    name_finding = next(f for f in findings if f["field"] == "subject.borrower_name")
+    name_finding = by_field["subject.borrower_name"]
     assert name_finding["sources"]["public_records"]["missing"] is False
-    owner_finding = next(f for f in findings if f["field"] == "subject.public_record_owner")
+    owner_finding = by_field["subject.public_record_owner"]
     assert owner_finding["sources"]["title"]["value"] == "Taylor Morgan"
     assert result["status"] == "fail"